@@ -82,6 +82,10 @@ class Client:
             bus=self.bus,
         )
         self.socket.settimeout(0.5)
+        self.socket.tcp_keepalive = self.config.tcp_keepalive
+        self.socket.unix_path = self.config.unix_path
+        self.socket.max_outbox_size = self.config.max_outbox_size
+        self.socket.allow_no_checksum = self.config.allow_no_checksum
         self._id_allocator = IDAllocator(max_ids=30000)
         self._sender: Sender = Sender(
             mode=Mode.CLIENT,
@@ -341,14 +345,14 @@ class Client:
         request_id = request.request_id
         self.bus.debug(f"send_and_wait: registering request {request_id}...")
 
-        self.request_handler.register(request_id)
+        future = self.request_handler.register(request_id)
 
         if not self.sender.send(request):
             self.bus.error(f"Failed to send request {request_id}...")
             self.request_handler.unregister(request_id)
             return None
 
-        return self.request_handler.wait(request_id, timeout)
+        return self.request_handler.wait(request_id, timeout, future)
 
     def ping_server(self, timeout: float = 5.0) -> Optional[float]:
         """
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import dataclasses
+from typing import Optional
 
 from ..internal.buffer_size import BufferSize
 from ..socket_core.core import SocketCore
@@ -15,7 +16,7 @@ class ClientConfig:
         server_addr:       Server address to connect to.
         port:              Server port to connect to.
         buffer_size:       Buffer size for receiving data in bytes.
-                           Use BufferSize enum for common presets (default: BufferSize.SMALL).
+                           Use BufferSize enum for common presets (default: BufferSize.STANDARD).
                            Can also be set to any custom integer value.
         max_message_size:  Maximum allowed message size in bytes (default: 10MB).
         handshake_timeout: Maximum time to wait for handshake completion (default: 5.0s).
@@ -27,14 +28,28 @@ class ClientConfig:
         socket_core:       Socket implementation to use (default: ASYNC).
                             Switch to THREADING or RUST (v3.0.0) without changing
                             any other code.
+        tcp_keepalive:     Enable SO_KEEPALIVE on the connection (default: False).
+                            Lets the OS notice a server that vanished without closing.
+        max_outbox_size:   Bytes queued for a server that is not reading before send()
+                            returns False and emits ErrorEvent.SEND (default: 4MB).
+                            ASYNC core only; THREADING sends block instead.
+        allow_no_checksum: Accept messages the server sent with ``checksum=False``
+                            (default: False). They are otherwise rejected. Only enable
+                            on a trusted transport.
+        unix_path:         Connect to the server's AF_UNIX socket at this path instead of
+                            server_addr/port (default: None = TCP).
     """
 
     server_addr: str = "127.0.0.1"
     port: int = 8080
-    buffer_size: int = BufferSize.SMALL
+    buffer_size: int = BufferSize.STANDARD
     max_message_size: int = 10 * 1024 * 1024  # 10 MB
     handshake_timeout: float = 5.0
     max_workers: int = 4
     retry: int = 0
     retry_delay: float = 1.0
     socket_core: SocketCore = SocketCore.ASYNC
+    tcp_keepalive: bool = False
+    max_outbox_size: int = 4 * 1024 * 1024  # 4 MB
+    allow_no_checksum: bool = False
+    unix_path: Optional[str] = None
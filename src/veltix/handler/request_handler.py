@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from queue import Empty, Queue
+from concurrent.futures import Future
+from concurrent.futures import TimeoutError as FutureTimeoutError
 from threading import Lock
 from typing import TYPE_CHECKING, Callable, Optional, Union
 
@@ -51,8 +52,11 @@ class RequestHandler:
         self.handshake_handler = HandshakeHandler(mode=mode, bus=self.bus)
         self._executor = CallbackExecutor(max_workers=max_workers, bus=self.bus)
 
-        self.pending_requests: dict[int, Queue] = {}
-        self.pending_requests_lock = Lock()
+        # Every access is a single dict get/set/pop, which is atomic, so the
+        # pending map needs no lock. Rules only resolve a future; wait() removes it.
+        # Every request gets exactly one response, so a Future (a Condition
+        # guarding a single result slot) is all send_and_wait() needs.
+        self.pending_requests: dict[int, Future[Response]] = {}
 
         self._routes: dict[MessageType, Callable] = {}
         self._routes_lock = Lock()
@@ -86,43 +90,50 @@ class RequestHandler:
 
         return True
 
-    def register(self, request_id: int) -> Queue:
+    def register(self, request_id: int) -> Future[Response]:
         """
         Register a pending request BEFORE sending it.
 
-        Avoids the race condition where the response arrives before the queue exists.
+        Avoids the race condition where the response arrives before the future exists.
         """
-        queue: Queue = Queue(maxsize=1)
-        with self.pending_requests_lock:
-            self.pending_requests[request_id] = queue
+        future: Future[Response] = Future()
+        self.pending_requests[request_id] = future
         self.bus.emit(
             MessageEvent.PENDING_REGISTERED,
             {
                 "request_id": request_id,
             },
         )
-        return queue
+        return future
 
     def unregister(self, request_id: int) -> None:
-        with self.pending_requests_lock:
-            self.pending_requests.pop(request_id, None)
+        self.pending_requests.pop(request_id, None)
 
-    def wait(self, request_id: int, timeout: float = 5.0) -> Optional[Response]:
+    def wait(
+        self,
+        request_id: int,
+        timeout: float = 5.0,
+        future: Optional[Future[Response]] = None,
+    ) -> Optional[Response]:
         """
         Wait for a response matching request_id. Must be called after register().
 
+        The entry stays registered until wait() returns, so a response that
+        arrives between register() and wait() is still returned. ``future`` may
+        be the one register() returned, to skip the lookup.
+
         Returns the Response if received within timeout, None otherwise.
         """
-        with self.pending_requests_lock:
-            queue = self.pending_requests.get(request_id)
+        if future is None:
+            future = self.pending_requests.get(request_id)
 
-        if queue is None:
+        if future is None:
             self.bus.error(f"No registered request for id={request_id}. Call register() first.")
             return None
 
         try:
-            return queue.get(timeout=timeout)  # type: ignore[no-any-return]
-        except Empty:
+            return future.result(timeout=timeout)
+        except FutureTimeoutError:
             self.bus.emit(
                 MessageEvent.PENDING_TIMEOUT,
                 {
@@ -133,8 +144,7 @@ class RequestHandler:
             self.bus.warning(f"Timeout waiting for response (id={request_id}) after {timeout}s")
             return None
         finally:
-            with self.pending_requests_lock:
-                self.pending_requests.pop(request_id, None)
+            self.pending_requests.pop(request_id, None)
 
     def set_on_recv(self, callback: Callable) -> None:
         self.on_recv = callback  # type: ignore[assignment]
@@ -1,9 +1,12 @@
 from ..exceptions import SenderError
 from ..internal.events import MessageEvent, ProtocolEvent
+from ..logger.levels import LogLevel
 from ..network.request import Request
 from ..network.system_types import PING, PONG
 from .rules_manager import MessageContext, Rule
 
+_PING_CODE = PING.code
+
 
 def _resolve_global_id(context: MessageContext) -> int:
     """Resolve the wire request ID for pending request matching.
@@ -26,9 +29,10 @@ class PingRule(Rule):
                 "from": "client" if context.is_server else "server",
             },
         )
-        context.handler.bus.debug(
-            f"Responding to PING with PONG (request_id={context.response.request_id})"
-        )
+        if context.handler.bus.is_enabled_for(LogLevel.DEBUG):
+            context.handler.bus.debug(
+                f"Responding to PING with PONG (request_id={context.response.request_id})"
+            )
         pong = Request(PONG, b"", request_id=context.response.request_id)
         sender = context.handler.sender
         if sender is None:
@@ -49,16 +53,15 @@ class PingRule(Rule):
 
     def can_handle(self, context: MessageContext) -> bool:
         """Return True if the message is a PING."""
-        return context.response.type == PING
+        return context.response.type.code == _PING_CODE
 
 
 class PendingRequestRule(Rule):
-    """Routes responses to a pending ``send_and_wait`` request queue."""
+    """Resolves the future of a pending ``send_and_wait`` request."""
 
     def can_handle(self, context: MessageContext) -> bool:
         global_id = _resolve_global_id(context)
-        with context.handler.pending_requests_lock:
-            return global_id in context.handler.pending_requests
+        return global_id in context.handler.pending_requests
 
     def handle(self, context: MessageContext) -> None:
         """No-op; the real work happens in :meth:`try_handle`."""
@@ -74,18 +77,22 @@ class PendingRequestRule(Rule):
             True if a pending request was satisfied.
         """
         global_id = _resolve_global_id(context)
-        with context.handler.pending_requests_lock:
-            queue = context.handler.pending_requests.get(global_id)
-        if queue is None:
+        # Only resolve the future: wait() removes the entry, so a response that
+        # arrives before the caller reaches wait() is still found there.
+        future = context.handler.pending_requests.get(global_id)
+        if future is None or future.done():
             return False
-        queue.put(context.response)
+        future.set_result(context.response)
         context.handler.bus.emit(
             MessageEvent.PENDING_SATISFIED,
             {
                 "request_id": global_id,
             },
         )
-        context.handler.bus.debug(f"Routing response to pending request (global_id={global_id})")
+        if context.handler.bus.is_enabled_for(LogLevel.DEBUG):
+            context.handler.bus.debug(
+                f"Routing response to pending request (global_id={global_id})"
+            )
         return True
 
 
@@ -93,9 +100,10 @@ class RouteRule(Rule):
     """Dispatches a message to its registered route handler."""
 
     def handle(self, context: MessageContext) -> None:
-        context.handler.bus.debug(
-            f"Dispatching to registered route for type {context.response.type}"
-        )
+        if context.handler.bus.is_enabled_for(LogLevel.DEBUG):
+            context.handler.bus.debug(
+                f"Dispatching to registered route for type {context.response.type}"
+            )
         route = context.handler.get_route(context.response.type)
         if route is None:
             context.handler.bus.warning(
@@ -1,16 +1,16 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
 from typing import TYPE_CHECKING, Optional
 
+from ..logger.levels import LogLevel
+
 if TYPE_CHECKING:
     from ..network.response import Response
     from ..server.client_info import ClientInfo
     from .request_handler import RequestHandler
 
 
-@dataclass
 class MessageContext:
     """Context object passed through the rule chain during message processing.
 
@@ -21,10 +21,19 @@ class MessageContext:
         is_server: True if the message is being processed by a server.
     """
 
-    response: Response
-    handler: RequestHandler
-    client: Optional[ClientInfo] = None
-    is_server: bool = False
+    __slots__ = ("response", "handler", "client", "is_server")
+
+    def __init__(
+        self,
+        response: Response,
+        handler: RequestHandler,
+        client: Optional[ClientInfo] = None,
+        is_server: bool = False,
+    ) -> None:
+        self.response = response
+        self.handler = handler
+        self.client = client
+        self.is_server = is_server
 
 
 class RulesManager:
@@ -47,13 +56,16 @@ class RulesManager:
         Returns:
             True if a rule handled the message, False if none matched.
         """
+        bus = context.handler.bus
         for rule in self._rules:
             if rule.try_handle(context):
-                context.handler.bus.debug(
-                    f"{rule.__class__.__name__} handling message type {context.response.type}"
-                )
+                if bus.is_enabled_for(LogLevel.DEBUG):
+                    bus.debug(
+                        f"{rule.__class__.__name__} handling message type {context.response.type}"
+                    )
                 return True
-        context.handler.bus.debug(f"No rule matched for message type {context.response.type}")
+        if bus.is_enabled_for(LogLevel.DEBUG):
+            bus.debug(f"No rule matched for message type {context.response.type}")
         return False
 
     def add_rule(self, rule: Rule) -> None:
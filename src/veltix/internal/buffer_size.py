@@ -5,6 +5,7 @@ from enum import IntEnum
 
 class BufferSize(IntEnum):
     SMALL = 1024  # 1 KB  — low data, low memory
-    MEDIUM = 8192  # 8 KB  — general purpose (default)
+    MEDIUM = 8192  # 8 KB  — general purpose
+    STANDARD = 16384  # 16 KB — default, one recv() per typical TCP read-ahead
     LARGE = 65536  # 64 KB — frequent large messages
     HUGE = 1048576  # 1 MB  — file transfers
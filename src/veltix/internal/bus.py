@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+from typing import Any, Callable
+
 from .._vendor.avyra import EventBus
 from ..logger.core import Logger
+from ..logger.levels import LogLevel
 from .events import (
     ClientEvent,
     ErrorEvent,
@@ -22,6 +25,16 @@ _ALL_EVENTS = [
     ReconnectEvent,
 ]
 
+_LOG_EVENTS = {
+    LogLevel.TRACE: LogEvent.TRACE,
+    LogLevel.DEBUG: LogEvent.DEBUG,
+    LogLevel.INFO: LogEvent.INFO,
+    LogLevel.SUCCESS: LogEvent.SUCCESS,
+    LogLevel.WARNING: LogEvent.WARNING,
+    LogLevel.ERROR: LogEvent.ERROR,
+    LogLevel.CRITICAL: LogEvent.CRITICAL,
+}
+
 
 class VeltixBus(EventBus):
     """Veltix event bus — wraps Avyra EventBus with sugar + auto-log subscriber.
@@ -43,13 +56,40 @@ class VeltixBus(EventBus):
 
     def _attach_logger(self) -> None:
         log = Logger.get_instance()
-        self.subscribe(LogEvent.TRACE, lambda e, m: log.trace(m))
-        self.subscribe(LogEvent.DEBUG, lambda e, m: log.debug(m))
-        self.subscribe(LogEvent.INFO, lambda e, m: log.info(m))
-        self.subscribe(LogEvent.SUCCESS, lambda e, m: log.success(m))
-        self.subscribe(LogEvent.WARNING, lambda e, m: log.warning(m))
-        self.subscribe(LogEvent.ERROR, lambda e, m: log.error(m))
-        self.subscribe(LogEvent.CRITICAL, lambda e, m: log.critical(m))
+        self._logger = log
+        # Kept so is_enabled_for() can tell these apart from user subscribers.
+        self._log_subscribers: dict[LogEvent, Callable[[Any, Any], None]] = {
+            LogEvent.TRACE: lambda e, m: log.trace(m),
+            LogEvent.DEBUG: lambda e, m: log.debug(m),
+            LogEvent.INFO: lambda e, m: log.info(m),
+            LogEvent.SUCCESS: lambda e, m: log.success(m),
+            LogEvent.WARNING: lambda e, m: log.warning(m),
+            LogEvent.ERROR: lambda e, m: log.error(m),
+            LogEvent.CRITICAL: lambda e, m: log.critical(m),
+        }
+        for event, subscriber in self._log_subscribers.items():
+            self.subscribe(event, subscriber)
+
+    # ── Level check ────────────────────────────────────────────────────────────
+
+    def is_enabled_for(self, level: LogLevel) -> bool:
+        """Check whether a log message at *level* would reach any subscriber.
+
+        Lets per-message code paths skip building f-strings that the Logger
+        would filter out anyway.
+
+        Args:
+            level: The :class:`LogLevel` to check.
+
+        Returns:
+            True if the Logger accepts *level* or another subscriber listens
+            to the matching ``LogEvent``.
+        """
+        if self._logger.is_enabled_for(level):
+            return True
+        event = _LOG_EVENTS[level]
+        logger_subscriber = self._log_subscribers[event]
+        return any(s is not logger_subscriber for s in self._subscribers[event])
 
     # ── Sugar emit ─────────────────────────────────────────────────────────────
 
@@ -2,15 +2,30 @@
 
 from __future__ import annotations
 
+import contextlib
+import errno
+import os
 import socket
+import stat
 from enum import Enum, auto
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Callable, Optional, Sequence, Union
 
 from ..logger.core import Logger
+from ..logger.levels import LogLevel
+from .buffer_size import BufferSize
 
 if TYPE_CHECKING:
     from ..socket_core.base_socket import BaseSocket
 
+HAS_SENDMSG = hasattr(socket.socket, "sendmsg")
+HAS_AF_UNIX = hasattr(socket, "AF_UNIX")
+_TCP_QUICKACK: Optional[int] = getattr(socket, "TCP_QUICKACK", None)
+
+# Errors recv() reports as "no data yet" rather than a failure.
+_TIMEOUT_ERRORS = (socket.timeout, BlockingIOError)
+
+MAX_RECV_BUFFER = int(BufferSize.LARGE)
+
 
 class RecvStatus(Enum):
     """Status of a recv() call."""
@@ -22,11 +37,15 @@ class RecvStatus(Enum):
 
 
 class RecvResult:
-    """Result of a recv() call."""
+    """Result of a recv() call.
+
+    When recv() reads into a caller-supplied buffer, ``data`` is a view into
+    that buffer and is only valid until the next read into it.
+    """
 
     __slots__ = ("status", "data")
 
-    def __init__(self, status: RecvStatus, data: Optional[bytes] = None) -> None:
+    def __init__(self, status: RecvStatus, data: Optional[Union[bytes, memoryview]] = None) -> None:
         self.status = status
         self.data = data
 
@@ -48,16 +67,30 @@ class RecvResult:
         return f"RecvResult({self.status.name})"
 
 
-def recv(conn: BaseSocket, buf_size: int = 1024) -> RecvResult:
+def recv(
+    conn: Union[BaseSocket, socket.socket],
+    buf_size: int = 1024,
+    buffer: Optional[memoryview] = None,
+) -> RecvResult:
     """
     Receive data from a socket with explicit status reporting.
 
     Works with both blocking (settimeout) and non-blocking sockets.
     For non-blocking sockets, BlockingIOError is reported as TIMEOUT.
+    When ``buffer`` is given the kernel writes straight into it via
+    ``recv_into`` and ``buf_size`` is ignored, so a reader that reuses one
+    buffer allocates no new bytes object per read.
     """
-    logger = Logger.get_instance()
-
+    # The logger is only looked up on the error paths: the OK/timeout paths run
+    # once per read and never log. It is not cached at import time because
+    # Logger.reset_instance() can replace the singleton.
     try:
+        if buffer is not None:
+            n = conn.recv_into(buffer)
+            if not n:
+                return RecvResult(RecvStatus.CLOSED)
+            return RecvResult(RecvStatus.OK, buffer[:n])
+
         data = conn.recv(buf_size)
 
         if not data:
@@ -65,20 +98,184 @@ def recv(conn: BaseSocket, buf_size: int = 1024) -> RecvResult:
 
         return RecvResult(RecvStatus.OK, data)
 
-    except socket.timeout:
-        return RecvResult(RecvStatus.TIMEOUT)
-
-    except BlockingIOError:
+    except _TIMEOUT_ERRORS:
         return RecvResult(RecvStatus.TIMEOUT)
 
-    except (ConnectionResetError, ConnectionAbortedError, BrokenPipeError):
-        logger.warning("Connection reset by peer")
+    except ConnectionError:
+        Logger.get_instance().warning("Connection reset by peer")
         return RecvResult(RecvStatus.ERROR)
 
     except OSError as e:
-        logger.debug(f"OSError on recv: {e}")
+        logger = Logger.get_instance()
+        if logger.is_enabled_for(LogLevel.DEBUG):
+            logger.debug(f"OSError on recv: {e}")
         return RecvResult(RecvStatus.ERROR)
 
     except Exception as e:
-        logger.error(f"Unexpected recv error: {type(e).__name__}: {e}")
+        Logger.get_instance().error(f"Unexpected recv error: {type(e).__name__}: {e}")
         return RecvResult(RecvStatus.ERROR)
+
+
+def grow_recv_buffer(buffer: memoryview, nbytes: int) -> memoryview:
+    """Return a buffer twice the size of ``buffer`` if a read of ``nbytes`` filled it.
+
+    Lets a reader start from the configured ``buffer_size`` and move to fewer,
+    larger reads once peers send big payloads. Growth stops at
+    ``MAX_RECV_BUFFER``, and a buffer already at or above it is kept as is.
+    """
+    size = len(buffer)
+    if nbytes < size or size >= MAX_RECV_BUFFER:
+        return buffer
+    return memoryview(bytearray(min(size * 2, MAX_RECV_BUFFER)))
+
+
+def tune_socket(sock: socket.socket, nodelay: bool = True, keepalive: bool = False) -> None:
+    """Apply per-connection TCP options to a freshly accepted or connected socket.
+
+    Sets TCP_NODELAY to ``nodelay``, enables SO_KEEPALIVE when ``keepalive``
+    is set (otherwise the OS default is kept), and on Linux asks for
+    TCP_QUICKACK. Quick-ack mode is not sticky (the kernel falls back to
+    delayed ACKs on its own), so it only speeds up the first exchanges such
+    as the handshake. AF_UNIX sockets are left untouched.
+    """
+    if HAS_AF_UNIX and sock.family == socket.AF_UNIX:
+        return
+    sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, int(nodelay))
+    if keepalive:
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+    if _TCP_QUICKACK is not None:
+        with contextlib.suppress(OSError):
+            sock.setsockopt(socket.IPPROTO_TCP, _TCP_QUICKACK, 1)
+
+
+def tune_buffers(
+    sock: socket.socket, rcvbuf: Optional[int] = None, sndbuf: Optional[int] = None
+) -> None:
+    """Set SO_RCVBUF / SO_SNDBUF on ``sock``, leaving unset sizes to the kernel.
+
+    A fixed size turns off Linux buffer autotuning, so only pass one for links
+    whose bandwidth-delay product exceeds what autotuning reaches. Linux caps
+    the request at ``net.core.rmem_max`` / ``net.core.wmem_max`` (and doubles
+    it for bookkeeping); raise those sysctls for buffers above a few hundred
+    KiB. Call it on a listener before ``listen()`` so the window scale is
+    negotiated with the larger buffer and accepted sockets inherit it.
+    """
+    if rcvbuf:
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, rcvbuf)
+    if sndbuf:
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, sndbuf)
+
+
+def listen_reuseport(
+    host: str,
+    port: int,
+    count: int,
+    setup: Optional[Callable[[socket.socket], None]] = None,
+) -> list[socket.socket]:
+    """Bind ``count`` listening sockets to ``(host, port)`` with SO_REUSEPORT.
+
+    The kernel then hashes incoming connections across them, so each one can
+    be drained by its own accept thread without contending on a single queue.
+    ``setup`` runs on every socket before ``bind``, for options that must be
+    in place before ``listen``, such as socket buffer sizes.
+
+    Raises:
+        OSError: If any socket cannot be bound; those already bound are closed.
+    """
+    listeners: list[socket.socket] = []
+    try:
+        for _ in range(count):
+            listener = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            listeners.append(listener)
+            listener.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            listener.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+            if setup is not None:
+                setup(listener)
+            listener.bind((host, port))
+            listener.listen()
+    except OSError:
+        for listener in listeners:
+            listener.close()
+        raise
+    return listeners
+
+
+def listen_unix(path: str) -> socket.socket:
+    """Create a listening AF_UNIX stream socket at ``path``.
+
+    A stale socket file left behind by a previous run is removed first. If a
+    server still answers at ``path`` it is left alone, and any other kind of
+    file at ``path`` makes the bind fail.
+
+    Raises:
+        OSError: If AF_UNIX is unavailable, another server is listening at
+            ``path`` (``EADDRINUSE``), or the path cannot be bound.
+    """
+    if not HAS_AF_UNIX:
+        raise OSError("AF_UNIX sockets are not supported on this platform")
+    with contextlib.suppress(FileNotFoundError):
+        if stat.S_ISSOCK(os.stat(path).st_mode):
+            try:
+                connect_unix(path, timeout=1.0).close()
+            except ConnectionRefusedError:
+                os.unlink(path)
+            else:
+                raise OSError(errno.EADDRINUSE, f"A server is already listening at {path}")
+    listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        listener.bind(path)
+        listener.listen()
+    except OSError:
+        listener.close()
+        raise
+    return listener
+
+
+def unlink_unix(path: str, inode: Optional[int]) -> None:
+    """Remove the socket file at ``path`` if it is still the one bound as ``inode``.
+
+    Leaves the path alone when another server has since replaced the file.
+    """
+    if inode is None:
+        return
+    with contextlib.suppress(OSError):
+        if os.stat(path).st_ino == inode:
+            os.unlink(path)
+
+
+def connect_unix(path: str, timeout: Optional[float] = None) -> socket.socket:
+    """Connect an AF_UNIX stream socket to ``path`` with the given timeout.
+
+    Raises:
+        OSError: If AF_UNIX is unavailable or nothing is listening at ``path``.
+    """
+    if not HAS_AF_UNIX:
+        raise OSError("AF_UNIX sockets are not supported on this platform")
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.settimeout(timeout)
+    try:
+        sock.connect(path)
+    except OSError:
+        sock.close()
+        raise
+    return sock
+
+
+def skip_sent(buffers: Sequence[Union[bytes, memoryview]], sent: int) -> list[memoryview]:
+    """Return views over what remains of ``buffers`` once ``sent`` bytes went out."""
+    rest = []
+    for buf in buffers:
+        view = memoryview(buf)
+        if sent >= len(view):
+            sent -= len(view)
+            continue
+        rest.append(view[sent:])
+        sent = 0
+    return rest
+
+
+def sendmsg_all(sock: socket.socket, buffers: Sequence[Union[bytes, memoryview]]) -> None:
+    """Gather-write every buffer to ``sock``, retrying after partial writes."""
+    rest = skip_sent(buffers, 0)
+    while rest:
+        rest = skip_sent(rest, sock.sendmsg(rest))
@@ -29,6 +29,8 @@ class LoggerConfig:
 
         # Advanced
         stream: Output stream for console logs
+        queue_output: Format and write records on a background thread, so the
+            logging call only enqueues the record
     """
 
     # Basic settings
@@ -45,6 +47,7 @@ class LoggerConfig:
 
     # Advanced
     stream: TextIO = dataclasses.field(default=sys.stdout)
+    queue_output: bool = False
 
     def __post_init__(self) -> None:
         """Validate and normalize configuration."""
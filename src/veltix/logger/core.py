@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+import atexit
 import logging
 import logging.handlers
+import queue
 import threading
 from typing import Optional
 
@@ -46,6 +48,8 @@ class Logger:
             self._internal.propagate = False
             self._console_handler: Optional[logging.StreamHandler] = None
             self._file_handler: Optional[logging.handlers.RotatingFileHandler] = None
+            self._queue_handler: Optional[logging.handlers.QueueHandler] = None
+            self._listener: Optional[logging.handlers.QueueListener] = None
             self._setup(config or LoggerConfig())
         elif config is not None:
             self._setup(config)
@@ -55,14 +59,7 @@ class Logger:
         self.config = config
         self._stats = dict.fromkeys(LogLevel, 0)
 
-        # Remove old handlers
-        if self._console_handler is not None:
-            self._internal.removeHandler(self._console_handler)
-            self._console_handler = None
-        if self._file_handler is not None:
-            self._internal.removeHandler(self._file_handler)
-            self._file_handler.close()
-            self._file_handler = None
+        self._remove_handlers()
 
         if not config.enabled:
             self._internal.setLevel(logging.CRITICAL + 10)
@@ -79,7 +76,7 @@ class Logger:
                 show_level=config.show_level,
             )
         )
-        self._internal.addHandler(self._console_handler)
+        handlers: list[logging.Handler] = [self._console_handler]
 
         # File handler
         if config.file_path is not None:
@@ -90,7 +87,46 @@ class Logger:
                 encoding="utf-8",
             )
             self._file_handler.setFormatter(VeltixFormatter(use_colors=False))
-            self._internal.addHandler(self._file_handler)
+            handlers.append(self._file_handler)
+
+        if config.queue_output:
+            # The caller only enqueues the record; the listener thread runs the
+            # formatters and does the stream/file I/O.
+            records: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+            self._queue_handler = logging.handlers.QueueHandler(records)
+            self._listener = logging.handlers.QueueListener(records, *handlers)
+            self._internal.addHandler(self._queue_handler)
+            self._listener.start()
+        else:
+            for handler in handlers:
+                self._internal.addHandler(handler)
+
+    def _stop_listener(self) -> None:
+        """Route records straight to the handlers and flush the queue listener."""
+        if self._listener is None or self._queue_handler is None:
+            return
+        self._internal.removeHandler(self._queue_handler)
+        self._queue_handler = None
+        for handler in self._listener.handlers:
+            self._internal.addHandler(handler)
+        self._listener.stop()
+        self._listener = None
+
+    def _remove_handlers(self) -> None:
+        """Detach and close the current handlers, flushing any queued records first."""
+        if self._queue_handler is not None:
+            self._internal.removeHandler(self._queue_handler)
+            self._queue_handler = None
+        if self._listener is not None:
+            self._listener.stop()
+            self._listener = None
+        if self._console_handler is not None:
+            self._internal.removeHandler(self._console_handler)
+            self._console_handler = None
+        if self._file_handler is not None:
+            self._internal.removeHandler(self._file_handler)
+            self._file_handler.close()
+            self._file_handler = None
 
     @classmethod
     def get_instance(cls, config: Optional[LoggerConfig] = None) -> Logger:
@@ -107,11 +143,7 @@ class Logger:
         """Reset the singleton (mainly for testing)."""
         with cls._lock:
             if cls._instance is not None:
-                if cls._instance._console_handler is not None:
-                    cls._instance._internal.removeHandler(cls._instance._console_handler)
-                if cls._instance._file_handler is not None:
-                    cls._instance._internal.removeHandler(cls._instance._file_handler)
-                    cls._instance._file_handler.close()
+                cls._instance._remove_handlers()
             cls._instance = None
 
     # ── Log methods ───────────────────────────────────────────────────────────
@@ -174,6 +206,19 @@ class Logger:
 
     # ── Internal ──────────────────────────────────────────────────────────────
 
+    def is_enabled_for(self, level: LogLevel) -> bool:
+        """Check whether a message at *level* would be logged.
+
+        Use it to skip building expensive log messages on hot paths.
+
+        Args:
+            level: The :class:`LogLevel` to check.
+
+        Returns:
+            True if logging is enabled and *level* passes the minimum level.
+        """
+        return self.config.enabled and level >= self.config.level
+
     def _log(self, level: LogLevel, message: str) -> None:
         if not self.config.enabled or level < self.config.level:
             return
@@ -212,3 +257,12 @@ class Logger:
         """
         with self._lock:
             return self._stats.copy()
+
+
+@atexit.register
+def _flush_at_exit() -> None:
+    # The QueueListener thread is a daemon; stop it so queued records are written.
+    # Later records go straight to the handlers, so they keep their formatting.
+    with Logger._lock:
+        if Logger._instance is not None:
+            Logger._instance._stop_listener()
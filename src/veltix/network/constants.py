@@ -6,6 +6,10 @@ MAGIC = b"VX"
 
 REQUEST_ID_SIZE = 2
 
-HEADER_STRUCT = struct.Struct(f">2sBHI4s{REQUEST_ID_SIZE}s")
+_REQUEST_ID_FORMATS = {1: "B", 2: "H", 4: "I", 8: "Q"}
+
+HEADER_STRUCT = struct.Struct(f">2sBHI4s{_REQUEST_ID_FORMATS[REQUEST_ID_SIZE]}")
 
 HEADER_SIZE = HEADER_STRUCT.size
+
+GATHER_THRESHOLD = 64 * 1024
@@ -13,3 +13,8 @@ class MessageFlag(IntFlag):
     """
 
     NONE = 0x00
+    NO_CHECKSUM = 0x01  # CRC32 field left zeroed by the sender; receiver must opt in
+
+
+# Plain int: masking with the IntFlag member goes through Python-level __and__.
+NO_CHECKSUM_BIT = int(MessageFlag.NO_CHECKSUM)
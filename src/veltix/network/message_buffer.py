@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import struct
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Optional, Union
 
 from .constants import HEADER_SIZE, MAGIC
 from .parser import MessageParser
@@ -29,13 +29,14 @@ class MessageBuffer:
     - Thread-safe when used with a single reader thread per instance
     """
 
-    __slots__ = ("_buffer", "_max_message_size", "_bus", "_max_buffer_size")
+    __slots__ = ("_buffer", "_max_message_size", "_bus", "_max_buffer_size", "_allow_no_checksum")
 
     def __init__(
         self,
         max_message_size: int = 10 * 1024 * 1024,
         max_buffer_size: int = MAX_BUFFER_SIZE,
         bus: Optional[VeltixBus] = None,
+        allow_no_checksum: bool = False,
     ) -> None:
         """Initialise the message buffer.
 
@@ -43,13 +44,15 @@ class MessageBuffer:
             max_message_size: Maximum allowed size of a single message in bytes.
             max_buffer_size: Hard limit on total buffer growth in bytes.
             bus: Optional event bus for error and debug logging.
+            allow_no_checksum: Accept messages sent without a CRC32 checksum.
         """
         self._buffer = bytearray()
         self._max_message_size = max_message_size
         self._max_buffer_size = max_buffer_size
         self._bus = bus
+        self._allow_no_checksum = allow_no_checksum
 
-    def add_data(self, data: bytes) -> None:
+    def add_data(self, data: Union[bytes, memoryview]) -> None:
         """Append raw bytes to the internal buffer.
 
         If adding *data* would exceed ``max_buffer_size``, the entire
@@ -80,57 +83,68 @@ class MessageBuffer:
             A list of :class:`Response` objects parsed from the buffer.
         """
         messages = []
-
-        while True:
-            if len(self._buffer) < HEADER_SIZE:
-                break
-
-            magic, content_size = _MAGIC_AND_SIZE.unpack_from(self._buffer, 0)
-            if magic != MAGIC:
-                self._resync()
-                continue
-
-            total_size = HEADER_SIZE + content_size
-
-            if total_size > self._max_message_size:
-                if self._bus:
-                    self._bus.error(
-                        f"Message size {total_size} exceeds maximum {self._max_message_size} — "
-                        f"possible corruption. Resyncing."
+        buffer = self._buffer
+        offset = 0
+        # Frames are parsed in place through a view and the consumed prefix is
+        # dropped once at the end, instead of re-slicing the buffer per message.
+        view = memoryview(buffer)
+
+        try:
+            while True:
+                if len(buffer) - offset < HEADER_SIZE:
+                    break
+
+                magic, content_size = _MAGIC_AND_SIZE.unpack_from(buffer, offset)
+                if magic != MAGIC:
+                    offset = self._resync(offset)
+                    continue
+
+                total_size = HEADER_SIZE + content_size
+
+                if total_size > self._max_message_size:
+                    if self._bus:
+                        self._bus.error(
+                            f"Message size {total_size} exceeds maximum {self._max_message_size} — "
+                            f"possible corruption. Resyncing."
+                        )
+                    offset = self._resync(offset)
+                    continue
+
+                if len(buffer) - offset < total_size:
+                    break
+
+                try:
+                    messages.append(
+                        MessageParser.parse(
+                            view[offset : offset + total_size],
+                            allow_no_checksum=self._allow_no_checksum,
+                        )
                     )
-                self._resync()
-                continue
-
-            if len(self._buffer) < total_size:
-                break
-
-            message_data = self._buffer[:total_size]
-
-            try:
-                response = MessageParser.parse(message_data)
-                self._buffer = self._buffer[total_size:]
-                messages.append(response)
-            except Exception as e:
-                if self._bus:
-                    self._bus.error(
-                        f"Failed to parse message ({len(message_data)} bytes): {type(e).__name__}: {e}. "
-                        f"Resyncing."
-                    )
-                self._resync()
+                    offset += total_size
+                except Exception as e:
+                    if self._bus:
+                        self._bus.error(
+                            f"Failed to parse message ({total_size} bytes): {type(e).__name__}: {e}. "
+                            f"Resyncing."
+                        )
+                    offset = self._resync(offset)
+        finally:
+            view.release()
+
+        if offset:
+            del buffer[:offset]
 
         return messages
 
-    def _resync(self) -> None:
-        idx = self._buffer.find(MAGIC, 1)
+    def _resync(self, offset: int) -> int:
+        idx = self._buffer.find(MAGIC, offset + 1)
         if idx == -1:
-            self.clear()
-        else:
-            discarded = idx
-            self._buffer = self._buffer[idx:]
-            if self._bus:
-                self._bus.debug(
-                    f"Resynced: discarded {discarded} bytes, found MAGIC at offset {idx}"
-                )
+            return len(self._buffer)
+        if self._bus:
+            self._bus.debug(
+                f"Resynced: discarded {idx - offset} bytes, found MAGIC at offset {idx - offset}"
+            )
+        return idx
 
     def clear(self) -> None:
         """Discard all data currently held in the buffer."""
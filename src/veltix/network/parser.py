@@ -7,6 +7,7 @@ from typing import Union
 
 from ..exceptions import RequestError
 from .constants import HEADER_SIZE, HEADER_STRUCT, MAGIC
+from .flags import NO_CHECKSUM_BIT
 from .response import Response
 from .types import MessageTypeRegistry
 
@@ -23,14 +24,22 @@ class MessageParser:
 
     @staticmethod
     def parse(
-        data: Union[bytes, bytearray],
+        data: Union[bytes, bytearray, memoryview],
         max_message_size: int = 10 * 1024 * 1024,
+        allow_no_checksum: bool = False,
     ) -> Response:
         """Parse raw protocol data into a Response object.
 
+        The payload is checksummed through a ``memoryview`` and copied only
+        once, into the returned Response. Messages sent with
+        ``checksum=False`` carry no CRC32 and are rejected unless
+        ``allow_no_checksum`` is set.
+
         Args:
             data: Raw message bytes received from the network.
             max_message_size: Maximum accepted message size in bytes.
+            allow_no_checksum: Accept messages flagged NO_CHECKSUM without
+                verifying them (default: False).
 
         Returns:
             The decoded Response object.
@@ -38,7 +47,8 @@ class MessageParser:
         Raises:
             RequestError: If the data is too short, too large, has an
                 invalid header, contains an unknown message type, has an
-                invalid payload size, or fails checksum validation.
+                invalid payload size, fails checksum validation, or has no
+                checksum while ``allow_no_checksum`` is False.
         """
         if len(data) < HEADER_SIZE:
             raise RequestError(f"Data too short: {len(data)} bytes (minimum {HEADER_SIZE})")
@@ -46,11 +56,9 @@ class MessageParser:
         if len(data) > max_message_size:
             raise RequestError(f"Message too large: {len(data)} bytes (maximum {max_message_size})")
 
-        header = data[:HEADER_SIZE]
-        content = data[HEADER_SIZE:]
+        content = memoryview(data)[HEADER_SIZE:]
 
-        magic, flags, code, size, hash_received, request_id_raw = HEADER_STRUCT.unpack(header)
-        request_id = int.from_bytes(request_id_raw, "big")
+        magic, flags, code, size, hash_received, request_id = HEADER_STRUCT.unpack_from(data)
 
         if magic != MAGIC:
             raise RequestError(f"Invalid magic bytes: {magic!r}")
@@ -62,13 +70,17 @@ class MessageParser:
         if not msg_type:
             raise RequestError(f"Unknown message type code: {code}")
 
-        hash_content = zlib.crc32(content).to_bytes(4, "big")
-        if hash_received != hash_content:
-            raise RequestError("Hash mismatch : corrupted data")
+        if flags & NO_CHECKSUM_BIT:
+            if not allow_no_checksum:
+                raise RequestError("Message has no checksum and allow_no_checksum is off")
+        else:
+            hash_content = zlib.crc32(content).to_bytes(4, "big")
+            if hash_received != hash_content:
+                raise RequestError("Hash mismatch : corrupted data")
 
         return Response(
             _type=msg_type,
-            content=bytes(content),
+            content=content.tobytes(),
             _hash=hash_received,
             _request_id=request_id,
         )
@@ -11,8 +11,8 @@ from typing import TYPE_CHECKING, Any, Optional
 
 from ..exceptions import RequestError
 from ..utils.encoding import encode_json, encode_utf8
-from .constants import HEADER_STRUCT, MAGIC, REQUEST_ID_SIZE
-from .flags import MessageFlag
+from .constants import HEADER_STRUCT, MAGIC
+from .flags import NO_CHECKSUM_BIT, MessageFlag
 
 if TYPE_CHECKING:
     from .response import Response
@@ -20,6 +20,7 @@ if TYPE_CHECKING:
 
 
 _UNSET = object()
+_ZERO_CHECKSUM = b"\x00" * 4
 
 
 class Request:
@@ -29,6 +30,8 @@ class Request:
     and protocol flags used during serialization.
     """
 
+    __slots__ = ("_type", "_type_code", "content", "request_id", "flags")
+
     def __init__(
         self,
         _type: MessageType,
@@ -37,6 +40,7 @@ class Request:
         text: Any = _UNSET,
         json: Any = _UNSET,
         request_id: Optional[int] = None,
+        checksum: bool = True,
     ) -> None:
         """Initialize a new request.
 
@@ -46,6 +50,11 @@ class Request:
             text: UTF-8 text to encode as the payload.
             json: Python object to serialize as JSON.
             request_id: Optional identifier used to correlate the request with a response.
+            checksum: Compute the CRC32 integrity checksum (default: True).
+                Set to False to skip it on both ends for small messages over a
+                trusted transport (localhost, IPC). The receiver must enable
+                ``allow_no_checksum`` or it rejects the message, and corruption
+                then goes undetected.
 
         Raises:
             RequestError:
@@ -69,8 +78,18 @@ class Request:
             self.content = encode_json(json)
 
         self.request_id: Optional[int] = request_id
-        self.flags: MessageFlag = MessageFlag.NONE
-        self.type: MessageType = _type
+        self.flags: MessageFlag = MessageFlag.NONE if checksum else MessageFlag.NO_CHECKSUM
+        self.type = _type
+
+    @property
+    def type(self) -> MessageType:
+        """Return the message type associated with this request."""
+        return self._type
+
+    @type.setter
+    def type(self, value: MessageType) -> None:
+        self._type = value
+        self._type_code = value.code
 
     def respond(self, response: Response) -> None:
         """Associate this request with a received response.
@@ -86,8 +105,9 @@ class Request:
     def compile(self) -> bytes:
         """Serialize the request into the Veltix wire format.
 
-        Builds the protocol header, calculates the content integrity hash,
-        and appends the raw payload.
+        Builds the protocol header, calculates the content integrity hash
+        (unless the request was created with ``checksum=False``), and appends
+        the raw payload.
 
         Raises:
             RequestError: If the payload exceeds the maximum supported size.
@@ -95,30 +115,41 @@ class Request:
         Returns:
             The serialized request as bytes.
         """
+        return self.compile_header() + self.content
+
+    def compile_header(self) -> bytes:
+        """Serialize only the protocol header for this request.
+
+        Useful to gather-write the header and ``content`` as separate buffers
+        instead of concatenating them, which copies the whole payload.
+
+        Raises:
+            RequestError: If the payload exceeds the maximum supported size.
+
+        Returns:
+            The serialized header as bytes.
+        """
         max_size = 2**32 - 1
         size = len(self.content)
 
         if size > max_size:
             raise RequestError(f"Content too large: {size} bytes (max: {max_size})")
 
-        hash_value = zlib.crc32(self.content).to_bytes(4, "big")
-        request_id_bytes = (
-            self.request_id.to_bytes(REQUEST_ID_SIZE, "big")
-            if self.request_id is not None
-            else b"\x00" * REQUEST_ID_SIZE
-        )
+        flags = int(self.flags)
+        if flags & NO_CHECKSUM_BIT:
+            hash_value = _ZERO_CHECKSUM
+        else:
+            hash_value = zlib.crc32(self.content).to_bytes(4, "big")
 
-        header = HEADER_STRUCT.pack(
+        return HEADER_STRUCT.pack(
             MAGIC,
-            int(self.flags),
-            self.type.code,
+            flags,
+            self._type_code,
             size,
             hash_value,
-            request_id_bytes,
+            self.request_id or 0,
         )
 
-        return header + self.content
-
     def __repr__(self) -> str:
         """Return a debug representation of the request."""
         preview = self.content[:20] + b"..." if len(self.content) > 20 else self.content
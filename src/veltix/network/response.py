@@ -20,7 +20,7 @@ _UNSET = object()
 _INVALID = object()
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(repr=False)
 class Response:
     """Represents a response received through the Veltix protocol.
 
@@ -31,10 +31,12 @@ class Response:
     through the :attr:`text` and :attr:`json` properties.
     """
 
+    __slots__ = ("type", "content", "_hash", "_request_id", "_text_cached", "_json_cached")
+
     type: MessageType
     content: bytes
-    _hash: bytes = dataclasses.field(repr=False)
-    _request_id: int = dataclasses.field(repr=False)
+    _hash: bytes
+    _request_id: int
 
     def __init__(
         self,
@@ -62,6 +64,10 @@ class Response:
         self._text_cached: Any = _UNSET
         self._json_cached: Any = _UNSET
 
+    def __repr__(self) -> str:
+        """Return a debug representation of the response."""
+        return f"Response(type={self.type!r}, content={self.content!r})"
+
     @property
     def request_id(self) -> int:
         """Return the request ID associated with this response.
@@ -7,12 +7,13 @@ from typing import TYPE_CHECKING, Callable, Optional, Sequence, Union
 from ..exceptions import SenderError
 from ..internal.events import ErrorEvent, MessageEvent
 from ..internal.mode import Mode
+from ..server.client_info import ClientInfo
+from .constants import GATHER_THRESHOLD
 
 if TYPE_CHECKING:
     from enum import Enum
 
     from ..internal.bus import VeltixBus
-    from ..server.client_info import ClientInfo
     from ..socket_core.base_socket import BaseSocket
     from .id_allocator import IDAllocator
     from .request import Request
@@ -103,7 +104,13 @@ class Sender:
             data.request_id = self._id_allocator.allocate()
 
         try:
-            target.send(data.compile())
+            if len(data.content) >= GATHER_THRESHOLD:
+                sent = target.sendv((data.compile_header(), data.content))
+            else:
+                sent = target.send(data.compile())
+            if not sent:
+                # The socket already reported the failure on ErrorEvent.SEND.
+                return False
             self._emit(
                 MessageEvent.SENT,
                 {
@@ -124,8 +131,6 @@ class Sender:
 
     @staticmethod
     def _resolve_socket(client: _ClientLike) -> BaseSocket:
-        from ..server.client_info import ClientInfo
-
         return client.conn if isinstance(client, ClientInfo) else client
 
     def _build_exclude_set(
@@ -166,7 +171,16 @@ class Sender:
             return True
 
         exclude = self._build_exclude_set(except_clients)
-        compiled = data.compile()
+        gather = len(data.content) >= GATHER_THRESHOLD
+        if gather:
+            buffers = (data.compile_header(), data.content)
+        else:
+            compiled = data.compile()
+        sent_payload = {
+            "type": data.type,
+            "length": len(data.content),
+            "mode": "broadcast",
+        }
         all_ok = True
 
         for client in list_of_client:
@@ -174,15 +188,11 @@ class Sender:
             if socket in exclude:
                 continue
             try:
-                socket.send(compiled)
-                self._emit(
-                    MessageEvent.SENT,
-                    {
-                        "type": data.type,
-                        "length": len(data.content),
-                        "mode": "broadcast",
-                    },
-                )
+                sent = socket.sendv(buffers) if gather else socket.send(compiled)
+                if not sent:
+                    all_ok = False
+                    continue
+                self._emit(MessageEvent.SENT, sent_payload)
             except (ConnectionResetError, BrokenPipeError) as e:
                 self._log_send_error(e, context="broadcast")
                 all_ok = False
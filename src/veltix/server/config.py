@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import dataclasses
+from typing import Optional
 
 from ..internal.buffer_size import BufferSize
 from ..socket_core.core import SocketCore
@@ -15,7 +16,7 @@ class ServerConfig:
         host:              Server listening address (default: '0.0.0.0').
         port:              Server listening port (default: 8080).
         buffer_size:       Buffer size for receiving data in bytes.
-                           Use BufferSize enum for common presets (default: BufferSize.SMALL).
+                           Use BufferSize enum for common presets (default: BufferSize.STANDARD).
                            Can also be set to any custom integer value.
         max_connection:    Maximum number of simultaneous connections (default: -1 = unlimited).
         max_message_size:  Maximum allowed message size in bytes (default: 10MB).
@@ -27,14 +28,49 @@ class ServerConfig:
                             any other code.
         id_window:         Number of unique IDs per direction in the protocol (default: 30000).
                             Sent to clients during the handshake. Must fit in REQUEST_ID_SIZE bytes.
+        tcp_nodelay:       Disable Nagle's algorithm on client connections (default: True).
+                            Keeps small messages (PING/PONG, control traffic) from waiting
+                            on ACK coalescing. Set to False for bulk-transfer workloads.
+        tcp_keepalive:     Enable SO_KEEPALIVE on client connections (default: False).
+                            Lets the OS notice peers that vanished without closing, on
+                            its own probe schedule (hours by default on Linux).
+        tcp_rcvbuf:        Explicit SO_RCVBUF in bytes for client connections (default: None).
+                            None keeps the kernel's receive-buffer autotuning, which is
+                            usually faster; only set it for high bandwidth-delay links.
+                            Linux caps it at net.core.rmem_max, so raise that sysctl too.
+        tcp_sndbuf:        Explicit SO_SNDBUF in bytes for client connections (default: None).
+                            Same trade-off as tcp_rcvbuf; capped at net.core.wmem_max.
+        acceptors:         Number of listening sockets sharing the port via SO_REUSEPORT,
+                            each with its own accept thread (default: 1). The kernel
+                            spreads new connections across them. THREADING core only;
+                            ASYNC accepts on its selector thread.
+        max_outbox_size:   Bytes queued per client for a peer that is not reading before
+                            send() returns False and emits ErrorEvent.SEND (default: 4MB).
+                            ASYNC core only; THREADING sends block instead.
+        allow_no_checksum: Accept messages clients sent with ``checksum=False``
+                            (default: False). They are otherwise rejected. Only enable
+                            on a trusted transport: corruption of those messages, including
+                            a flipped flag bit, then goes undetected.
+        unix_path:         Listen on an AF_UNIX socket at this path instead of host/port
+                            (default: None = TCP). Skips the TCP/IP stack for clients on
+                            the same host. Binding fails if another server is already
+                            listening there. The socket file is removed on close_all().
     """
 
     host: str = "0.0.0.0"
     port: int = 8080
-    buffer_size: int = BufferSize.SMALL
+    buffer_size: int = BufferSize.STANDARD
     max_connection: int = -1
     max_message_size: int = 10 * 1024 * 1024  # 10 MB
     handshake_timeout: float = 5.0
     max_workers: int = 4
     socket_core: SocketCore = SocketCore.ASYNC
     id_window: int = 30000
+    tcp_nodelay: bool = True
+    tcp_keepalive: bool = False
+    tcp_rcvbuf: Optional[int] = None
+    tcp_sndbuf: Optional[int] = None
+    acceptors: int = 1
+    max_outbox_size: int = 4 * 1024 * 1024  # 4 MB
+    allow_no_checksum: bool = False
+    unix_path: Optional[str] = None
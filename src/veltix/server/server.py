@@ -14,12 +14,12 @@ from ..network.id_allocator import ClientAllocator, IDAllocator
 from ..network.request import Request
 from ..network.sender import Mode, Sender
 from ..network.system_types import PING
+from .client_info import ClientInfo
 
 if TYPE_CHECKING:
     from ..network.response import Response
     from ..network.types import MessageType
     from ..socket_core.base_socket import BaseSocket
-    from .client_info import ClientInfo
     from .config import ServerConfig
 
 
@@ -102,6 +102,14 @@ class Server:
             bus=self.bus,
         )
         self.socket.handshake_timeout = self.config.handshake_timeout
+        self.socket.tcp_nodelay = self.config.tcp_nodelay
+        self.socket.tcp_keepalive = self.config.tcp_keepalive
+        self.socket.tcp_rcvbuf = self.config.tcp_rcvbuf
+        self.socket.tcp_sndbuf = self.config.tcp_sndbuf
+        self.socket.acceptors = self.config.acceptors
+        self.socket.unix_path = self.config.unix_path
+        self.socket.max_outbox_size = self.config.max_outbox_size
+        self.socket.allow_no_checksum = self.config.allow_no_checksum
         self.socket.client_allocator = self.client_allocator
 
     # -------------------------------------------------------------------------
@@ -185,8 +193,6 @@ class Server:
         Returns:
             True if the send succeeded.
         """
-        from .client_info import ClientInfo
-
         socket = client.conn if isinstance(client, ClientInfo) else client
         return self.sender.send(request, client=socket)
 
@@ -226,14 +232,14 @@ class Server:
         request_id = request.request_id
         self.bus.debug(f"send_and_wait: {request_id}... → {client.addr}")
 
-        self.request_handler.register(request_id)
+        future = self.request_handler.register(request_id)
 
         if not self.sender.send(request, client=client.conn):
             self.bus.error(f"Failed to send request {request_id}... to {client.addr}")
             self.request_handler.unregister(request_id)
             return None
 
-        return self.request_handler.wait(request_id, timeout)
+        return self.request_handler.wait(request_id, timeout, future)
 
     def ping_client(self, client: ClientInfo, timeout: float = 5.0) -> Optional[float]:
         """
@@ -354,7 +360,10 @@ class Server:
                 "port": self.config.port,
             },
         )
-        self.bus.info(f"Server started on {self.config.host}:{self.config.port}")
+        if self.config.unix_path:
+            self.bus.info(f"Server started on unix:{self.config.unix_path}")
+        else:
+            self.bus.info(f"Server started on {self.config.host}:{self.config.port}")
 
     def close_all(self) -> None:
         """Stop the server and close all client connections."""
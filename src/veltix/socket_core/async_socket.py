@@ -3,16 +3,30 @@
 from __future__ import annotations
 
 import contextlib
+import os
 import selectors
 import socket
 import threading
-from typing import TYPE_CHECKING, Optional, Union, cast
+import time
+from typing import TYPE_CHECKING, Optional, Sequence, Union, cast
 
 from ..internal.events import ClientEvent, ErrorEvent, MessageEvent, ServerEvent
+from ..internal.network import (
+    HAS_SENDMSG,
+    connect_unix,
+    grow_recv_buffer,
+    listen_unix,
+    sendmsg_all,
+    skip_sent,
+    tune_buffers,
+    tune_socket,
+    unlink_unix,
+)
 from ..internal.network import recv as _network_recv
+from ..logger.levels import LogLevel
 from ..network.message_buffer import MessageBuffer
 from ..server.client_info import ClientInfo
-from .base_socket import BaseSocket
+from .base_socket import DEFAULT_MAX_OUTBOX_SIZE, BaseSocket
 from .managers.clients_manager import ClientEntry, ClientsManager
 
 if TYPE_CHECKING:
@@ -20,6 +34,8 @@ if TYPE_CHECKING:
     from ..internal.bus import VeltixBus
     from ..network.id_allocator import ClientAllocator
 
+_Watched = Union[socket.socket, "AsyncSocket"]
+
 
 class AsyncSocket(BaseSocket):
     """Selector-based socket implementation for Veltix."""
@@ -39,6 +55,15 @@ class AsyncSocket(BaseSocket):
         self.max_message_size = max_message_size
         self.request_handler = request_handler
         self.handshake_timeout: float = 5.0
+        self.tcp_nodelay: bool = True
+        self.tcp_keepalive: bool = False
+        self.tcp_rcvbuf: Optional[int] = None
+        self.tcp_sndbuf: Optional[int] = None
+        self.acceptors: int = 1
+        self.unix_path: Optional[str] = None
+        self._unix_inode: Optional[int] = None
+        self.max_outbox_size: int = DEFAULT_MAX_OUTBOX_SIZE
+        self.allow_no_checksum: bool = False
         self.client_allocator: Optional[ClientAllocator] = None
 
         self._sock: socket.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
@@ -48,6 +73,12 @@ class AsyncSocket(BaseSocket):
 
         self._client_buffer = MessageBuffer(max_message_size)
 
+        self._outbox = bytearray()
+        self._send_lock = threading.Lock()
+        self._write_watch: Optional[tuple[selectors.BaseSelector, _Watched, object]] = None
+        # Scratch buffer for reads; only the selector thread touches it.
+        self._recv_view: Optional[memoryview] = None
+
         self.bus.debug("AsyncSocket initialized")
 
     @classmethod
@@ -59,6 +90,9 @@ class AsyncSocket(BaseSocket):
         max_message_size: int,
         handshake_timeout: float = 5.0,
         nonblocking: bool = True,
+        tcp_nodelay: bool = True,
+        tcp_keepalive: bool = False,
+        max_outbox_size: int = DEFAULT_MAX_OUTBOX_SIZE,
     ) -> AsyncSocket:
         """Create a properly initialized client socket instance."""
         conn = cls.__new__(cls)
@@ -74,17 +108,25 @@ class AsyncSocket(BaseSocket):
         conn.max_message_size = max_message_size
         conn.request_handler = request_handler
         conn.handshake_timeout = handshake_timeout
+        conn.tcp_nodelay = tcp_nodelay
+        conn.tcp_keepalive = tcp_keepalive
+        conn.max_outbox_size = max_outbox_size
 
         conn._sock = sock
         conn._sock.setblocking(not nonblocking)
         conn._sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
         with contextlib.suppress(AttributeError, OSError):
             conn._sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
-        conn._sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        tune_socket(sock, tcp_nodelay, tcp_keepalive)
 
         conn._selector = selectors.DefaultSelector()
 
         conn._client_buffer = MessageBuffer(max_message_size)
+
+        conn._outbox = bytearray()
+        conn._send_lock = threading.Lock()
+        conn._write_watch = None
+        conn._recv_view = None
         conn.bus.debug(f"created client socket instance (fd={conn._sock.fileno()})")
         return conn
 
@@ -93,26 +135,144 @@ class AsyncSocket(BaseSocket):
     def recv(self, buf_size: int) -> bytes:
         return self._sock.recv(buf_size)
 
+    def recv_into(self, buffer: memoryview) -> int:
+        return self._sock.recv_into(buffer)
+
     def send(self, data: bytes) -> bool:
+        # Bytes the kernel does not take right away are queued and flushed by the
+        # selector loop on EVENT_WRITE, so a slow peer never stalls the caller.
+        # Once max_outbox_size bytes are queued, further sends are refused so a
+        # peer that stops reading cannot grow the queue without bound.
         try:
-            self._sock.sendall(data)
-            self.bus.debug(f"send {len(data)} bytes")
+            full = False
+            with self._send_lock:
+                if self._outbox:
+                    full = len(self._outbox) + len(data) > self.max_outbox_size
+                    if not full:
+                        self._outbox += data
+                        return True
+                else:
+                    try:
+                        sent = self._sock.send(data)
+                    except BlockingIOError:
+                        sent = 0
+                    if sent < len(data):
+                        self._queue_remainder(data, sent)
+            if full:
+                return self._refuse_send(len(data))
+            if self.bus.is_enabled_for(LogLevel.DEBUG):
+                self.bus.debug(f"send {len(data)} bytes")
             return True
-        except BlockingIOError:
-            try:
-                self._sock.setblocking(True)
-                self._sock.sendall(data)
-                self._sock.setblocking(False)
-                return True
-            except Exception as e:
-                self.bus.emit(ErrorEvent.SEND, {"error": str(e)})
-                self.bus.debug(f"send BlockingIOError fallback failed: {e}")
-                return False
         except Exception as e:
             self.bus.emit(ErrorEvent.SEND, {"error": str(e)})
             self.bus.debug(f"send failed: {e}")
             return False
 
+    def sendv(self, buffers: Sequence[bytes]) -> bool:
+        if not HAS_SENDMSG:
+            return super().sendv(buffers)
+        try:
+            full = False
+            with self._send_lock:
+                if self._outbox:
+                    size = sum(len(buf) for buf in buffers)
+                    full = len(self._outbox) + size > self.max_outbox_size
+                    if not full:
+                        for buf in buffers:
+                            self._outbox += buf
+                        return True
+                else:
+                    try:
+                        sent = self._sock.sendmsg(buffers)
+                    except BlockingIOError:
+                        sent = 0
+                    rest = skip_sent(buffers, sent)
+                    if rest and self._write_watch is None:
+                        sendmsg_all(self._sock, rest)
+                    elif rest:
+                        for view in rest:
+                            self._outbox += view
+                        self._watch_outbox()
+            if full:
+                return self._refuse_send(size)
+            return True
+        except Exception as e:
+            self.bus.emit(ErrorEvent.SEND, {"error": str(e)})
+            self.bus.debug(f"sendv failed: {e}")
+            return False
+
+    def _refuse_send(self, size: int) -> bool:
+        # Called outside _send_lock so ErrorEvent.SEND subscribers may send again.
+        error = f"outbox full ({self.max_outbox_size} bytes), peer is not reading"
+        self.bus.emit(ErrorEvent.SEND, {"error": error, "size": size})
+        self.bus.warning(f"send of {size} bytes refused: {error}")
+        return False
+
+    def _queue_remainder(self, data: bytes, sent: int) -> None:
+        if self._write_watch is None:
+            self._sock.sendall(memoryview(data)[sent:])
+            return
+        self._outbox += memoryview(data)[sent:]
+        self._watch_outbox()
+
+    def _watch_outbox(self) -> None:
+        if self._write_watch is None:
+            return
+        selector, fileobj, key_data = self._write_watch
+        selector.modify(fileobj, selectors.EVENT_READ | selectors.EVENT_WRITE, data=key_data)
+
+    def _watch_writes(
+        self, selector: selectors.BaseSelector, fileobj: _Watched, data: object
+    ) -> None:
+        with self._send_lock:
+            self._write_watch = (selector, fileobj, data)
+
+    def _flush_outbox(self) -> None:
+        with self._send_lock:
+            if self._outbox:
+                try:
+                    sent = self._sock.send(self._outbox)
+                except BlockingIOError:
+                    return
+                except OSError as e:
+                    self.bus.emit(ErrorEvent.SEND, {"error": str(e)})
+                    self.bus.debug(f"flush failed: {e}")
+                    self._outbox.clear()
+                else:
+                    del self._outbox[:sent]
+                    if self._outbox:
+                        return
+            if self._write_watch is not None:
+                selector, fileobj, key_data = self._write_watch
+                with contextlib.suppress(KeyError, ValueError, OSError):
+                    selector.modify(fileobj, selectors.EVENT_READ, data=key_data)
+
+    def _flush_nowait(self) -> bool:
+        # One non-blocking write of whatever is queued; True once the outbox is empty.
+        with self._send_lock:
+            self._write_watch = None
+            if self._outbox:
+                try:
+                    self._sock.setblocking(False)
+                    sent = self._sock.send(self._outbox)
+                except BlockingIOError:
+                    return False
+                except OSError:
+                    self._outbox.clear()
+                    return True
+                del self._outbox[:sent]
+            return not self._outbox
+
+    def _drain_outbox(self, timeout: float) -> None:
+        with self._send_lock:
+            self._write_watch = None
+            if not self._outbox:
+                return
+            with contextlib.suppress(OSError):
+                self._sock.settimeout(timeout)
+                self._sock.sendall(self._outbox)
+            self._outbox.clear()
+
     def _shutdown_socket(self) -> None:
         with contextlib.suppress(OSError):
             self._sock.shutdown(socket.SHUT_RDWR)
@@ -129,12 +289,20 @@ class AsyncSocket(BaseSocket):
     # ── Server ────────────────────────────────────────────────────────────────
 
     def bind(self, host: str, port: int, max_client: int, buffer_size: int, timeout: float) -> bool:
+        self.client_manager.allow_no_checksum = self.allow_no_checksum
+        if self.unix_path:
+            listener = listen_unix(self.unix_path)
+            self._unix_inode = os.stat(self.unix_path).st_ino
+            self._sock.close()
+            self._sock = listener
+        else:
+            self._sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            with contextlib.suppress(AttributeError, OSError):
+                self._sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+            tune_buffers(self._sock, self.tcp_rcvbuf, self.tcp_sndbuf)
+            self._sock.bind((host, port))
+            self._sock.listen()
         self._sock.setblocking(False)
-        self._sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-        with contextlib.suppress(AttributeError, OSError):
-            self._sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
-        self._sock.bind((host, port))
-        self._sock.listen()
         self._selector.register(self._sock, selectors.EVENT_READ, data="listen")
         self._running_event.set()
         self._selector_thread = threading.Thread(
@@ -147,15 +315,30 @@ class AsyncSocket(BaseSocket):
         return self._running_event.is_set()
 
     def _selector_loop(self, max_client: int, buffer_size: int) -> None:
-        while self._running_event.is_set():
-            events = self._selector.select(0.5)
-
-            for key, _ in events:
+        self._recv_view = memoryview(bytearray(buffer_size))
+        select = self._selector.select
+        running = self._running_event.is_set
+        while running():
+            try:
+                events = select(0.5)
+            except (OSError, ValueError):
+                if not running():
+                    break
+                raise
+
+            for key, mask in events:
+                if mask & selectors.EVENT_WRITE:
+                    if key.data == "client":
+                        self._flush_outbox()
+                    else:
+                        cast("AsyncSocket", key.fileobj)._flush_outbox()
+                    if not mask & selectors.EVENT_READ:
+                        continue
                 if key.data == "listen":
                     self._accept_client(max_client)
                 elif key.data == "client":
                     self._handle_self_read(buffer_size)
-                    if not self._running_event.is_set():
+                    if not running():
                         break
                 else:
                     self._handle_server_client(key.data, buffer_size)
@@ -191,10 +374,10 @@ class AsyncSocket(BaseSocket):
             self.bus.emit(ErrorEvent.ACCEPT, {"error": str(e)})
             self.bus.error(f"accept failed: {e}")
             return
+        if self.unix_path:
+            addr = (self.unix_path, 0)
         self.bus.debug(f"accepted client from {addr}")
 
-        conn.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
-
         client_sock = AsyncSocket._create_client_instance(
             conn,
             self.bus,
@@ -202,6 +385,9 @@ class AsyncSocket(BaseSocket):
             self.max_message_size,
             handshake_timeout=self.handshake_timeout,
             nonblocking=False,
+            tcp_nodelay=self.tcp_nodelay,
+            tcp_keepalive=self.tcp_keepalive,
+            max_outbox_size=self.max_outbox_size,
         )
         id_offset = self.client_allocator.register() if self.client_allocator else 0
         client = ClientInfo(
@@ -231,6 +417,7 @@ class AsyncSocket(BaseSocket):
         client.handshake_done = True
         conn.setblocking(False)
         self._selector.register(client_sock, selectors.EVENT_READ, data=client_id)
+        client_sock._watch_writes(self._selector, client_sock, client_id)
         self.id_count += 1
         self.bus.info(
             f"New client connected: {addr} (total: {self.client_manager.count()}/{max_client})"
@@ -246,9 +433,11 @@ class AsyncSocket(BaseSocket):
         if not entry:
             return
 
-        sock = entry.info.conn
+        # Read from the raw socket to skip the wrapper's recv_into frame per read.
+        sock = cast("AsyncSocket", entry.info.conn)._sock
 
-        result = _network_recv(sock, buffer_size)
+        view = self._recv_view
+        result = _network_recv(sock, buffer_size, view)
 
         if result.timed_out:
             return
@@ -259,11 +448,16 @@ class AsyncSocket(BaseSocket):
             return
 
         data = result.data or b""
-        self.bus.debug(f"client {client_id} recv {len(data)} bytes")
+        debug = self.bus.is_enabled_for(LogLevel.DEBUG)
+        if debug:
+            self.bus.debug(f"client {client_id} recv {len(data)} bytes")
         entry.buffer.add_data(data)
+        if view is not None:
+            self._recv_view = grow_recv_buffer(view, len(data))
         messages = entry.buffer.extract_messages()
         if messages:
-            self.bus.debug(f"client {client_id} extracted {len(messages)} messages")
+            if debug:
+                self.bus.debug(f"client {client_id} extracted {len(messages)} messages")
             for message in messages:
                 self.bus.emit(
                     MessageEvent.RECEIVED,
@@ -276,7 +470,8 @@ class AsyncSocket(BaseSocket):
                 self.request_handler.handle(message, entry.info)
 
     def _handle_self_read(self, buffer_size: int) -> None:
-        result = _network_recv(self, buffer_size)
+        view = self._recv_view
+        result = _network_recv(self._sock, buffer_size, view)
 
         if result.timed_out:
             return
@@ -288,11 +483,16 @@ class AsyncSocket(BaseSocket):
             return
 
         data = result.data or b""
-        self.bus.debug(f"self_read: recv {len(data)} bytes")
+        debug = self.bus.is_enabled_for(LogLevel.DEBUG)
+        if debug:
+            self.bus.debug(f"self_read: recv {len(data)} bytes")
         self._client_buffer.add_data(data)
+        if view is not None:
+            self._recv_view = grow_recv_buffer(view, len(data))
         messages = self._client_buffer.extract_messages()
         if messages:
-            self.bus.debug(f"self_read: extracted {len(messages)} messages")
+            if debug:
+                self.bus.debug(f"self_read: extracted {len(messages)} messages")
             for message in messages:
                 self.bus.emit(
                     MessageEvent.RECEIVED,
@@ -322,11 +522,13 @@ class AsyncSocket(BaseSocket):
         with contextlib.suppress(KeyError):
             self._selector.unregister(client_sock)
 
+        client_sock._flush_nowait()
         client_sock._shutdown_socket()
         with contextlib.suppress(OSError):
             client_sock._sock.close()
 
-        self.client_manager.remove_client(entry.id)
+        if not self.client_manager.remove_client(entry.id):
+            return
 
         try:
             self.bus.emit(ServerEvent.ON_DISCONNECT, entry.info)
@@ -341,7 +543,16 @@ class AsyncSocket(BaseSocket):
             self._shutdown_socket()
             with contextlib.suppress(OSError):
                 self._sock.close()
-            self.client_manager.iter_on_clients(self._close_server_client)
+            if self.unix_path:
+                unlink_unix(self.unix_path, self._unix_inode)
+            entries = self.client_manager.get_all_clients()
+            # Flush every outbox before the shutdown pass; shutting a socket down
+            # first would discard whatever it still had queued.
+            _drain_outboxes([cast("AsyncSocket", entry.info.conn) for entry in entries], 0.2)
+            for entry in entries:
+                cast("AsyncSocket", entry.info.conn)._shutdown_socket()
+            for entry in entries:
+                self._close_server_client(entry)
             self._selector.close()
             if self._selector_thread and self._selector_thread != threading.current_thread():
                 self._selector_thread.join(timeout=0.2)
@@ -352,8 +563,17 @@ class AsyncSocket(BaseSocket):
             return False
 
     def connect(self, host: str, port: int, buffer_size: int, timeout: float) -> bool:
+        self._client_buffer = MessageBuffer(
+            self.max_message_size, allow_no_checksum=self.allow_no_checksum
+        )
         try:
-            self._sock.connect((host, port))
+            if self.unix_path:
+                sock = connect_unix(self.unix_path, self._sock.gettimeout())
+                self._sock.close()
+                self._sock = sock
+            else:
+                self._sock.connect((host, port))
+                tune_socket(self._sock, self.tcp_nodelay, self.tcp_keepalive)
 
             success, meta = self.request_handler.handshake_handler.do_client_handshake(self._sock)
             if not success:
@@ -366,6 +586,7 @@ class AsyncSocket(BaseSocket):
             self._sock.setblocking(False)
             self._running_event.set()
             self._selector.register(self._sock, selectors.EVENT_READ, data="client")
+            self._watch_writes(self._selector, self._sock, "client")
             self._selector_thread = threading.Thread(
                 target=self._selector_loop, args=(0, buffer_size), daemon=True
             )
@@ -386,6 +607,7 @@ class AsyncSocket(BaseSocket):
             self.bus.debug("disconnecting client socket")
             self._running_event.clear()
             self._selector.unregister(self._sock)
+            self._drain_outbox(timeout)
             self._shutdown_socket()
             self._sock.close()
             if self._selector_thread and threading.current_thread() != self._selector_thread:
@@ -396,3 +618,26 @@ class AsyncSocket(BaseSocket):
         except Exception as e:
             self.bus.debug(f"disconnect failed: {e}")
             return False
+
+
+def _drain_outboxes(conns: Sequence[AsyncSocket], timeout: float) -> None:
+    # Flush all outboxes together against one deadline, so close time does not
+    # grow with the number of stalled clients. Whatever is left is dropped.
+    deadline = time.monotonic() + timeout
+    pending = [conn for conn in conns if not conn._flush_nowait()]
+    if not pending:
+        return
+    with selectors.DefaultSelector() as selector:
+        for conn in pending:
+            with contextlib.suppress(ValueError, OSError):
+                selector.register(conn._sock, selectors.EVENT_WRITE, data=conn)
+        while selector.get_map():
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            for key, _ in selector.select(remaining):
+                if key.data._flush_nowait():
+                    selector.unregister(key.fileobj)
+    for conn in pending:
+        with conn._send_lock:
+            conn._outbox.clear()
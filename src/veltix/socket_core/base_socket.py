@@ -3,13 +3,15 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Optional, Union
+from typing import TYPE_CHECKING, Optional, Sequence, Union
 
 if TYPE_CHECKING:
     from ..internal.bus import VeltixBus
     from ..network.id_allocator import ClientAllocator
     from .managers.clients_manager import ClientEntry, ClientsManager
 
+DEFAULT_MAX_OUTBOX_SIZE = 4 * 1024 * 1024  # 4 MB
+
 
 class BaseSocket(ABC):
     """Abstract base class defining the socket backend interface.
@@ -22,12 +24,33 @@ class BaseSocket(ABC):
     Attributes:
         client_manager: Manages connected client entries.
         handshake_timeout: Timeout in seconds for the handshake phase.
+        tcp_nodelay: Whether accepted client connections disable Nagle's algorithm.
+        tcp_keepalive: Whether connections enable SO_KEEPALIVE.
+        tcp_rcvbuf: Explicit SO_RCVBUF for the listener and accepted sockets, or None
+            to keep kernel autotuning.
+        tcp_sndbuf: Explicit SO_SNDBUF for the listener and accepted sockets, or None
+            to keep kernel autotuning.
+        acceptors: Number of SO_REUSEPORT listeners with their own accept thread.
+        allow_no_checksum: Whether received messages sent without a CRC32
+            checksum are accepted.
+        max_outbox_size: Bytes a backend may queue for a peer that is not reading
+            before it refuses further sends.
+        unix_path: Filesystem path of an AF_UNIX socket to bind or connect to
+            instead of host/port, or None for TCP.
         bus: Event bus for structured observability.
         client_allocator: Optional ID allocator for client-bound request IDs.
     """
 
     client_manager: ClientsManager
     handshake_timeout: float
+    tcp_nodelay: bool
+    tcp_keepalive: bool
+    tcp_rcvbuf: Optional[int]
+    tcp_sndbuf: Optional[int]
+    acceptors: int
+    unix_path: Optional[str]
+    max_outbox_size: int
+    allow_no_checksum: bool
     bus: VeltixBus
     client_allocator: Optional[ClientAllocator]
 
@@ -43,6 +66,36 @@ class BaseSocket(ABC):
         """
         ...
 
+    def sendv(self, buffers: Sequence[bytes]) -> bool:
+        """Send several buffers back to back as one contiguous stream.
+
+        Backends that support vectored I/O override this to avoid joining the
+        buffers; the default implementation concatenates and calls ``send``.
+
+        Args:
+            buffers: The byte buffers to send, in order.
+
+        Returns:
+            True if the data was sent successfully, False otherwise.
+        """
+        return self.send(b"".join(buffers))
+
+    def recv_into(self, buffer: memoryview) -> int:
+        """Receive data from the connection directly into ``buffer``.
+
+        Backends override this with ``socket.recv_into``; the default
+        implementation copies the result of ``recv``.
+
+        Args:
+            buffer: Writable buffer to fill; at most ``len(buffer)`` bytes are read.
+
+        Returns:
+            The number of bytes written, 0 when the peer closed the connection.
+        """
+        data = self.recv(len(buffer))
+        buffer[: len(data)] = data
+        return len(data)
+
     @abstractmethod
     def close(self) -> bool:
         """Close the socket and release associated resources.
@@ -43,11 +43,14 @@ class ClientsManager:
     """Thread-safe registry that tracks all connected clients.
 
     Each client is stored as a :class:`ClientEntry` keyed by a monotonically
-    increasing integer ID. All public methods acquire an internal lock, making
-    the manager safe for concurrent use from accept and receive threads.
+    increasing integer ID. Single-key lookups, removals and the count rely on
+    dict operations being atomic and take no lock; ID assignment and snapshots
+    of the registry are serialised by an internal lock. The manager is safe
+    for concurrent use from accept and receive threads.
 
     Attributes:
         max_message_size: Maximum allowed message size in bytes per client buffer.
+        allow_no_checksum: Whether client buffers accept messages sent without a checksum.
         clients: Mapping of client IDs to their :class:`ClientEntry`.
         id_count: Counter for the next client ID to assign.
     """
@@ -60,6 +63,7 @@ class ClientsManager:
             bus: Optional event bus for structured logging.
         """
         self.max_message_size = max_message_size or (10 * 1024 * 1024)
+        self.allow_no_checksum = False
         self.clients: dict[int, ClientEntry] = {}
         self._clients_lock = Lock()
         self.id_count = 0
@@ -79,7 +83,11 @@ class ClientsManager:
             self.clients[self.id_count] = ClientEntry(
                 id=self.id_count,
                 info=client_info,
-                buffer=MessageBuffer(self.max_message_size, bus=self._bus),
+                buffer=MessageBuffer(
+                    self.max_message_size,
+                    bus=self._bus,
+                    allow_no_checksum=self.allow_no_checksum,
+                ),
             )
             return self.id_count
 
@@ -92,9 +100,7 @@ class ClientsManager:
         Returns:
             True if the client was found and removed, False otherwise.
         """
-        with self._clients_lock:
-            entry = self.clients.pop(id_client, None)
-            return entry is not None
+        return self.clients.pop(id_client, None) is not None
 
     def get_client(self, id_client: int) -> Optional[ClientEntry]:
         """Look up a client by its ID.
@@ -105,8 +111,7 @@ class ClientsManager:
         Returns:
             The matching :class:`ClientEntry`, or ``None`` if not found.
         """
-        with self._clients_lock:
-            return self.clients.get(id_client)
+        return self.clients.get(id_client)
 
     def has_client_id(self, client_id: int) -> bool:
         """Check whether a client with the given ID is registered.
@@ -117,8 +122,7 @@ class ClientsManager:
         Returns:
             True if the client exists in the registry.
         """
-        with self._clients_lock:
-            return client_id in self.clients
+        return client_id in self.clients
 
     def has_client_info(self, client_info: ClientInfo) -> bool:
         """Check whether a :class:`ClientInfo` is registered.
@@ -129,8 +133,7 @@ class ClientsManager:
         Returns:
             True if a matching entry exists.
         """
-        with self._clients_lock:
-            return any(client.info == client_info for client in self.clients.values())
+        return any(client.info == client_info for client in self.get_all_clients())
 
     def get_all_clients(self) -> list[ClientEntry]:
         """Return a snapshot list of all registered clients.
@@ -161,8 +164,7 @@ class ClientsManager:
         Returns:
             The current client count.
         """
-        with self._clients_lock:
-            return len(self.clients)
+        return len(self.clients)
 
     def get_clients_by_tag(self, tag: str, value: Any = None) -> list[ClientEntry]:
         """Return clients that have a specific tag, optionally matching a value.
@@ -175,10 +177,10 @@ class ClientsManager:
         Returns:
             A list of matching :class:`ClientEntry` instances.
         """
-        with self._clients_lock:
-            if value is None:
-                return [e for e in self.clients.values() if e.info.has_tag(tag)]
-            return [e for e in self.clients.values() if e.info.get_tag(tag) == value]
+        entries = self.get_all_clients()
+        if value is None:
+            return [e for e in entries if e.info.has_tag(tag)]
+        return [e for e in entries if e.info.get_tag(tag) == value]
 
     @staticmethod
     def to_sockets(entries: list[ClientEntry]) -> list[BaseSocket]:
@@ -3,16 +3,31 @@
 from __future__ import annotations
 
 import contextlib
+import os
+import selectors
 import socket
 import threading
 import time
-from typing import TYPE_CHECKING, Optional, Union, cast
+from typing import TYPE_CHECKING, Optional, Sequence, Union, cast
 
 from ..internal.events import ClientEvent, ErrorEvent, MessageEvent, ServerEvent
-from ..internal.network import RecvResult, recv
+from ..internal.network import (
+    HAS_SENDMSG,
+    RecvResult,
+    connect_unix,
+    grow_recv_buffer,
+    listen_reuseport,
+    listen_unix,
+    recv,
+    sendmsg_all,
+    tune_buffers,
+    tune_socket,
+    unlink_unix,
+)
+from ..logger.levels import LogLevel
 from ..network.message_buffer import MessageBuffer
 from ..server.client_info import ClientInfo
-from .base_socket import BaseSocket
+from .base_socket import DEFAULT_MAX_OUTBOX_SIZE, BaseSocket
 from .managers.clients_manager import ClientEntry, ClientsManager
 
 if TYPE_CHECKING:
@@ -39,10 +54,22 @@ class ThreadingSocket(BaseSocket):
         self._running_event = threading.Event()
         self.start_th: Optional[threading.Thread] = None
         self.thread_handler: Optional[threading.Thread] = None
+        self._wakers: list[socket.socket] = []
+        self._extra_listeners: list[socket.socket] = []
+        self._acceptor_threads: list[threading.Thread] = []
 
         self.max_message_size = max_message_size
         self.request_handler = request_handler
         self.handshake_timeout: float = 5.0
+        self.tcp_nodelay: bool = True
+        self.tcp_keepalive: bool = False
+        self.tcp_rcvbuf: Optional[int] = None
+        self.tcp_sndbuf: Optional[int] = None
+        self.acceptors: int = 1
+        self.unix_path: Optional[str] = None
+        self._unix_inode: Optional[int] = None
+        self.max_outbox_size: int = DEFAULT_MAX_OUTBOX_SIZE
+        self.allow_no_checksum: bool = False
         self.client_allocator: Optional[ClientAllocator] = None
 
         self._sock: socket.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
@@ -56,12 +83,16 @@ class ThreadingSocket(BaseSocket):
         request_handler: RequestHandler,
         max_message_size: int,
         handshake_timeout: float = 5.0,
+        tcp_nodelay: bool = True,
+        tcp_keepalive: bool = False,
     ) -> ThreadingSocket:
         """Create a properly initialized client socket instance."""
         conn = cls.__new__(cls)
         conn.bus = bus
         conn._sock = sock
-        conn._sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        tune_socket(sock, tcp_nodelay, tcp_keepalive)
+        conn.tcp_nodelay = tcp_nodelay
+        conn.tcp_keepalive = tcp_keepalive
         conn.request_handler = request_handler
         conn.max_message_size = max_message_size
         conn.handshake_timeout = handshake_timeout
@@ -69,6 +100,10 @@ class ThreadingSocket(BaseSocket):
         conn.client_manager = ClientsManager(max_message_size, bus=bus)
         conn.start_th = None
         conn.thread_handler = None
+        conn._wakers = []
+        conn._extra_listeners = []
+        conn._acceptor_threads = []
+        conn.acceptors = 1
         conn.threads = {}
         conn._threads_lock = threading.Lock()
         conn.n_th = 0
@@ -80,6 +115,9 @@ class ThreadingSocket(BaseSocket):
     def recv(self, buf_size: int) -> bytes:
         return self._sock.recv(buf_size)
 
+    def recv_into(self, buffer: memoryview) -> int:
+        return self._sock.recv_into(buffer)
+
     def send(self, data: bytes) -> bool:
         try:
             self._sock.sendall(data)
@@ -89,6 +127,17 @@ class ThreadingSocket(BaseSocket):
             self.bus.error(f"send failed: {e}")
             return False
 
+    def sendv(self, buffers: Sequence[bytes]) -> bool:
+        if not HAS_SENDMSG:
+            return super().sendv(buffers)
+        try:
+            sendmsg_all(self._sock, buffers)
+            return True
+        except Exception as e:
+            self.bus.emit(ErrorEvent.SEND, {"error": str(e)})
+            self.bus.error(f"sendv failed: {e}")
+            return False
+
     def _shutdown_socket(self) -> None:
         with contextlib.suppress(OSError):
             self._sock.shutdown(socket.SHUT_RDWR)
@@ -105,11 +154,20 @@ class ThreadingSocket(BaseSocket):
     def bind(self, host: str, port: int, max_client: int, buffer_size: int, timeout: float) -> bool:
         if self._running_event.is_set():
             return False
-        self._sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-        with contextlib.suppress(AttributeError, OSError):
-            self._sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
-        self._sock.bind((host, port))
-        self._sock.listen()
+        self.client_manager.allow_no_checksum = self.allow_no_checksum
+        if self.unix_path:
+            listener = listen_unix(self.unix_path)
+            self._unix_inode = os.stat(self.unix_path).st_ino
+            self._sock.close()
+            self._sock = listener
+        else:
+            self._sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            with contextlib.suppress(AttributeError, OSError):
+                self._sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+            tune_buffers(self._sock, self.tcp_rcvbuf, self.tcp_sndbuf)
+            self._sock.bind((host, port))
+            self._sock.listen()
+            self._bind_extra_listeners(host)
         self._running_event.set()
         self.start_th = threading.Thread(
             target=self._accept_loop,
@@ -117,14 +175,78 @@ class ThreadingSocket(BaseSocket):
             daemon=True,
         )
         self.start_th.start()
+        for listener in self._extra_listeners:
+            thread = threading.Thread(
+                target=self._accept_loop,
+                args=(host, port, max_client, buffer_size, timeout, listener),
+                daemon=True,
+            )
+            thread.start()
+            self._acceptor_threads.append(thread)
         return True
 
+    def _bind_extra_listeners(self, host: str) -> None:
+        # With SO_REUSEPORT the kernel spreads incoming connections across every
+        # listener bound to the port, each drained by its own accept thread.
+        if self.acceptors <= 1:
+            return
+        if not hasattr(socket, "SO_REUSEPORT"):
+            self.bus.warning("SO_REUSEPORT is not supported here — using a single acceptor")
+            return
+        port = self._sock.getsockname()[1]
+
+        # Only buffer sizes: TCP_NODELAY is applied per connection by tune_socket().
+        def setup(listener: socket.socket) -> None:
+            tune_buffers(listener, self.tcp_rcvbuf, self.tcp_sndbuf)
+
+        try:
+            self._extra_listeners = listen_reuseport(host, port, self.acceptors - 1, setup)
+        except OSError as e:
+            self.bus.warning(f"Could not bind extra acceptors on {host}:{port}: {e}")
+
     def _accept_loop(
-        self, host: str, port: int, max_client: int, buffer_size: int, timeout: float
+        self,
+        host: str,
+        port: int,
+        max_client: int,
+        buffer_size: int,
+        timeout: float,
+        listener: Optional[socket.socket] = None,
     ) -> None:
-        self._sock.settimeout(timeout)
-        self.bus.info(f"Server listening on {host}:{port}")
+        # Block on the listener until a client arrives; close_all() writes to the
+        # wakeup pair so shutdown does not wait for a polling timeout.
+        if listener is None:
+            listener = self._sock
+            self.bus.info(f"Server listening on {host}:{port}")
+        wake_r, wake_w = socket.socketpair()
+        self._wakers.append(wake_w)
+        selector = selectors.DefaultSelector()
+        selector.register(wake_r, selectors.EVENT_READ)
 
+        try:
+            try:
+                listener.setblocking(False)
+                selector.register(listener, selectors.EVENT_READ)
+            except (OSError, ValueError):
+                # close_all() closed the listener before this thread got going.
+                if self._running_event.is_set():
+                    raise
+                return
+            self._run_accept_loop(listener, selector, max_client, buffer_size, timeout)
+        finally:
+            selector.close()
+            self._wakers.remove(wake_w)
+            wake_r.close()
+            wake_w.close()
+
+    def _run_accept_loop(
+        self,
+        listener: socket.socket,
+        selector: selectors.BaseSelector,
+        max_client: int,
+        buffer_size: int,
+        timeout: float,
+    ) -> None:
         while self._running_event.is_set():
             try:
                 if 0 < max_client <= self.client_manager.count():
@@ -146,13 +268,24 @@ class ThreadingSocket(BaseSocket):
                     time.sleep(0.1)
                     continue
 
-                conn_, addr = self._sock.accept()
+                selector.select()
+                if not self._running_event.is_set():
+                    return
+                try:
+                    conn_, addr = listener.accept()
+                except BlockingIOError:
+                    continue
+                if self.unix_path:
+                    addr = (self.unix_path, 0)
+                conn_.setblocking(True)
                 conn = ThreadingSocket._create_client_instance(
                     conn_,
                     self.bus,
                     self.request_handler,
                     self.max_message_size,
                     handshake_timeout=self.handshake_timeout,
+                    tcp_nodelay=self.tcp_nodelay,
+                    tcp_keepalive=self.tcp_keepalive,
                 )
 
                 with self._n_th_lock:
@@ -184,8 +317,6 @@ class ThreadingSocket(BaseSocket):
                 with self._threads_lock:
                     self.threads[thread_id] = thread
 
-            except socket.timeout:
-                continue
             except OSError:
                 self.bus.emit(ErrorEvent.ACCEPT, {"error": "OSError"})
                 self._running_event.clear()
@@ -220,14 +351,20 @@ class ThreadingSocket(BaseSocket):
         except Exception as e:
             self.bus.error(f"ServerEvent.ON_CONNECT error: {type(e).__name__}: {e}")
 
-        while self._running_event.is_set():
-            result = recv(entry.info.conn, buffer_size)
+        # Reading from the raw socket skips the wrapper's recv_into frame per read.
+        running = self._running_event.is_set
+        sock = cast("ThreadingSocket", entry.info.conn)._sock
+        process = self._process_server_message
+        view = memoryview(bytearray(buffer_size))
+        while running():
+            result = recv(sock, buffer_size, view)
 
             if result.timed_out:
                 continue
 
-            if not self._process_server_message(result, entry):
+            if not process(result, entry):
                 break
+            view = grow_recv_buffer(view, len(result.data or b""))
 
     def _process_server_message(self, result: RecvResult, entry: ClientEntry) -> bool:
         if result.timed_out:
@@ -241,11 +378,14 @@ class ThreadingSocket(BaseSocket):
         try:
             entry.buffer.add_data(result.data or b"")
             messages = entry.buffer.extract_messages()
+            debug = self.bus.is_enabled_for(LogLevel.DEBUG)
 
             for response in messages:
-                self.bus.debug(
-                    f"Message from {entry.info.addr}: {response.type.name} (code={response.type.code})"
-                )
+                if debug:
+                    self.bus.debug(
+                        f"Message from {entry.info.addr}: "
+                        f"{response.type.name} (code={response.type.code})"
+                    )
                 self.bus.emit(
                     MessageEvent.RECEIVED,
                     {
@@ -268,20 +408,30 @@ class ThreadingSocket(BaseSocket):
         return True
 
     def _close_server_client(self, entry: ClientEntry) -> None:
+        # The client thread and close_all() can both get here; only the caller
+        # that actually removes the entry reports the disconnect.
+        removed = self.client_manager.remove_client(entry.id)
         entry.info.conn.close()
 
         with self._threads_lock:
             thread = self.threads.pop(entry.info.thread_id, None)
-            if thread and thread != threading.current_thread():
-                thread.join(timeout=0.2)
+        if thread and thread != threading.current_thread():
+            thread.join(timeout=0.2)
 
-        self.client_manager.remove_client(entry.id)
+        if not removed:
+            return
 
         try:
             self.bus.emit(ServerEvent.ON_DISCONNECT, entry.info)
         except Exception as e:
             self.bus.error(f"ServerEvent.ON_DISCONNECT error: {type(e).__name__}: {e}")
 
+    def _shutdown_clients(self) -> None:
+        # Flip every connection to closed first so all client threads leave
+        # recv() at once instead of one per sequential close.
+        for entry in self.client_manager.get_all_clients():
+            cast("ThreadingSocket", entry.info.conn)._shutdown_socket()
+
     def close_client(self, client: Union[ClientEntry, int]) -> bool:
         if isinstance(client, ClientEntry):
             self._close_server_client(client)
@@ -293,15 +443,30 @@ class ThreadingSocket(BaseSocket):
             self._close_server_client(entry)
             return True
 
+    def _wake_accept_loops(self) -> None:
+        for wake in list(self._wakers):
+            with contextlib.suppress(OSError):
+                wake.send(b"\0")
+
     def close_all(self) -> bool:
         try:
             self._running_event.clear()
+            self._wake_accept_loops()
             self._shutdown_socket()
             with contextlib.suppress(OSError):
                 self._sock.close()
+            for listener in self._extra_listeners:
+                with contextlib.suppress(OSError):
+                    listener.close()
+            if self.unix_path:
+                unlink_unix(self.unix_path, self._unix_inode)
+            self._shutdown_clients()
             self.client_manager.iter_on_clients(self._close_server_client)
             if self.start_th and self.start_th != threading.current_thread():
                 self.start_th.join(timeout=0.2)
+            for thread in self._acceptor_threads:
+                if thread != threading.current_thread():
+                    thread.join(timeout=0.2)
             if self.thread_handler and self.thread_handler != threading.current_thread():
                 self.thread_handler.join(timeout=0.2)
             return True
@@ -315,8 +480,15 @@ class ThreadingSocket(BaseSocket):
 
     def connect(self, host: str, port: int, buffer_size: int, timeout: float) -> bool:
         try:
-            self.bus.info(f"Connecting to {host}:{port}")
-            self._sock.connect((host, port))
+            if self.unix_path:
+                self.bus.info(f"Connecting to unix:{self.unix_path}")
+                sock = connect_unix(self.unix_path, self._sock.gettimeout())
+                self._sock.close()
+                self._sock = sock
+            else:
+                self.bus.info(f"Connecting to {host}:{port}")
+                self._sock.connect((host, port))
+                tune_socket(self._sock, self.tcp_nodelay, self.tcp_keepalive)
 
             success, meta = self.request_handler.handshake_handler.do_client_handshake(self._sock)
             if not success:
@@ -347,10 +519,14 @@ class ThreadingSocket(BaseSocket):
             return False
 
     def _handle_client(self, buffer_size: int, timeout: float) -> None:
-        message_buffer = MessageBuffer(max_message_size=self.max_message_size)
+        message_buffer = MessageBuffer(
+            max_message_size=self.max_message_size, allow_no_checksum=self.allow_no_checksum
+        )
+        view = memoryview(bytearray(buffer_size))
+        sock = self._sock
 
         while self._running_event.is_set():
-            result = recv(self, buffer_size)
+            result = recv(sock, buffer_size, view)
 
             if result.timed_out:
                 continue
@@ -361,12 +537,16 @@ class ThreadingSocket(BaseSocket):
                 break
 
             try:
-                message_buffer.add_data(result.data or b"")
+                data = result.data or b""
+                message_buffer.add_data(data)
+                view = grow_recv_buffer(view, len(data))
+                debug = self.bus.is_enabled_for(LogLevel.DEBUG)
 
                 for response in message_buffer.extract_messages():
-                    self.bus.debug(
-                        f"Message from server: {response.type.name} (code={response.type.code})"
-                    )
+                    if debug:
+                        self.bus.debug(
+                            f"Message from server: {response.type.name} (code={response.type.code})"
+                        )
                     self.bus.emit(
                         MessageEvent.RECEIVED,
                         {
@@ -52,3 +52,37 @@ class TestLogger:
         stats = logger.get_stats()
         assert stats[LogLevel.INFO] == 2
         assert stats[LogLevel.ERROR] == 1
+
+    def test_logger_is_enabled_for(self, reset_logger):
+        logger = Logger.get_instance(LoggerConfig(level=LogLevel.INFO))
+        assert logger.is_enabled_for(LogLevel.INFO) is True
+        assert logger.is_enabled_for(LogLevel.ERROR) is True
+        assert logger.is_enabled_for(LogLevel.DEBUG) is False
+        logger.disable()
+        assert logger.is_enabled_for(LogLevel.CRITICAL) is False
+
+    def test_bus_is_enabled_for(self, reset_logger):
+        from veltix.internal.bus import VeltixBus
+        from veltix.internal.events import LogEvent
+
+        Logger.get_instance(LoggerConfig(level=LogLevel.INFO))
+        bus = VeltixBus()
+        assert bus.is_enabled_for(LogLevel.INFO) is True
+        assert bus.is_enabled_for(LogLevel.DEBUG) is False
+
+        received = []
+        bus.subscribe(LogEvent.DEBUG, lambda e, m: received.append(m))
+        assert bus.is_enabled_for(LogLevel.DEBUG) is True
+
+    def test_bus_is_enabled_for_sole_user_subscriber(self, reset_logger):
+        from veltix.internal.bus import VeltixBus
+        from veltix.internal.events import LogEvent
+
+        Logger.get_instance(LoggerConfig(level=LogLevel.INFO))
+        bus = VeltixBus()
+        bus.clear(LogEvent.DEBUG)
+        assert bus.is_enabled_for(LogLevel.DEBUG) is False
+
+        received = []
+        bus.subscribe(LogEvent.DEBUG, lambda e, m: received.append(m))
+        assert bus.is_enabled_for(LogLevel.DEBUG) is True
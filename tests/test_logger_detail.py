@@ -1,5 +1,8 @@
 """Detailed tests for Logger submodules: configure, config validation, Formatter, LogLevel."""
 
+import io
+import subprocess
+import sys
 from pathlib import Path
 
 import pytest
@@ -89,6 +92,61 @@ class TestLoggerConfigure:
         assert logger.config.use_colors is False
 
 
+class TestLoggerQueueOutput:
+    def test_records_are_written_by_the_listener(self, reset_logger):
+        stream = io.StringIO()
+        logger = Logger.get_instance(LoggerConfig(stream=stream, queue_output=True))
+        assert logger._listener is not None
+        logger.info("queued message")
+        logger.configure(LoggerConfig(stream=stream))
+        assert "queued message" in stream.getvalue()
+
+    def test_reset_stops_listener(self, reset_logger):
+        logger = Logger.get_instance(LoggerConfig(stream=io.StringIO(), queue_output=True))
+        listener = logger._listener
+        Logger.reset_instance()
+        assert listener is not None
+        assert listener._thread is None
+
+    def test_queued_records_flushed_at_exit(self):
+        script = (
+            "import sys\n"
+            "from veltix import Logger, LoggerConfig\n"
+            "logger = Logger.get_instance(LoggerConfig(stream=sys.stdout, queue_output=True))\n"
+            "for i in range(1000):\n"
+            "    logger.info(f'line {i}')\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", script], capture_output=True, text=True, timeout=30
+        )
+        assert result.returncode == 0, result.stderr
+        assert len(result.stdout.splitlines()) == 1000
+
+    @pytest.mark.parametrize("queued", [True, False])
+    def test_records_after_exit_flush_keep_formatting(self, queued):
+        # atexit runs hooks in reverse order, so this one runs after Veltix's.
+        script = (
+            "import atexit, sys\n"
+            "atexit.register(lambda: Logger.get_instance().info('late line'))\n"
+            "from veltix import Logger, LoggerConfig\n"
+            "Logger.get_instance(\n"
+            f"    LoggerConfig(stream=sys.stdout, use_colors=False, queue_output={queued})\n"
+            ")\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", script], capture_output=True, text=True, timeout=30
+        )
+        assert result.returncode == 0, result.stderr
+        assert "INFO" in result.stdout
+        assert "late line" in result.stdout
+        assert result.stderr == ""
+
+    def test_queue_output_off_by_default(self, reset_logger):
+        logger = Logger.get_instance()
+        assert logger._listener is None
+        assert logger._queue_handler is None
+
+
 class TestLoggerFileRotation:
     def test_file_rotation_config(self, reset_logger, tmp_path):
         log_file = tmp_path / "test.log"
@@ -232,3 +232,15 @@ class TestMessageBuffer:
 
         assert len(messages) == 1
         assert messages[0].content == b""
+
+    def test_unchecksummed_message_needs_opt_in(self, test_message_type):
+        """Messages sent with checksum=False are dropped unless the buffer allows them."""
+        compiled = Request(test_message_type, b"trusted", checksum=False).compile()
+
+        strict = MessageBuffer()
+        strict.add_data(compiled)
+        assert strict.extract_messages() == []
+
+        relaxed = MessageBuffer(allow_no_checksum=True)
+        relaxed.add_data(compiled)
+        assert [m.content for m in relaxed.extract_messages()] == [b"trusted"]
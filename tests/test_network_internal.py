@@ -1,12 +1,29 @@
 """Tests for internal network utilities, BufferSize, events list, and system types."""
 
+import errno
+import os
 import socket
+from unittest.mock import MagicMock
 
 import pytest
 
 from veltix.exceptions import NetworkError, TimeoutError
 from veltix.internal.buffer_size import BufferSize
-from veltix.internal.network import RecvResult, RecvStatus, recv
+from veltix.internal.network import (
+    HAS_SENDMSG,
+    MAX_RECV_BUFFER,
+    RecvResult,
+    RecvStatus,
+    grow_recv_buffer,
+    listen_reuseport,
+    listen_unix,
+    recv,
+    sendmsg_all,
+    skip_sent,
+    tune_buffers,
+    tune_socket,
+    unlink_unix,
+)
 from veltix.network.types import MessageTypeRegistry
 
 # ── Exceptions ────────────────────────────────────────────────────────────────
@@ -110,6 +127,225 @@ class TestRecvFunction:
         # On some platforms unconnected socket may raise OSError
         assert result.status in (RecvStatus.ERROR, RecvStatus.TIMEOUT)
 
+    @pytest.mark.parametrize(
+        ("error", "status"),
+        [
+            (socket.timeout(), RecvStatus.TIMEOUT),
+            (BlockingIOError(), RecvStatus.TIMEOUT),
+            (ConnectionResetError(), RecvStatus.ERROR),
+            (BrokenPipeError(), RecvStatus.ERROR),
+            (OSError("boom"), RecvStatus.ERROR),
+        ],
+    )
+    def test_recv_classifies_errors(self, error, status):
+        class _Raising:
+            def recv(self, _size):
+                raise error
+
+        assert recv(_Raising(), 1024).status == status
+
+    def test_recv_into_buffer_returns_view(self):
+        left, right = socket.socketpair()
+        try:
+            view = memoryview(bytearray(16))
+            left.sendall(b"hello")
+            result = recv(right, buffer=view)
+            assert result.ok
+            assert bytes(result.data) == b"hello"
+            assert result.data.obj is view.obj
+
+            left.close()
+            assert recv(right, buffer=view).status == RecvStatus.CLOSED
+        finally:
+            right.close()
+
+
+class TestGrowRecvBuffer:
+    def test_partial_read_keeps_buffer(self):
+        view = memoryview(bytearray(1024))
+        assert grow_recv_buffer(view, 100) is view
+
+    def test_full_read_doubles_buffer(self):
+        view = memoryview(bytearray(1024))
+        assert len(grow_recv_buffer(view, 1024)) == 2048
+
+    def test_growth_is_capped(self):
+        view = memoryview(bytearray(MAX_RECV_BUFFER - 1))
+        assert len(grow_recv_buffer(view, len(view))) == MAX_RECV_BUFFER
+
+    def test_large_configured_buffer_is_kept(self):
+        view = memoryview(bytearray(MAX_RECV_BUFFER * 2))
+        assert grow_recv_buffer(view, len(view)) is view
+
+
+@pytest.mark.skipif(not hasattr(socket, "SO_REUSEPORT"), reason="SO_REUSEPORT not available")
+class TestListenReuseport:
+    def test_binds_every_listener_to_the_same_port(self):
+        probe = socket.socket()
+        probe.bind(("127.0.0.1", 0))
+        port = probe.getsockname()[1]
+        probe.close()
+
+        seen = []
+        listeners = listen_reuseport("127.0.0.1", port, 3, setup=seen.append)
+        try:
+            assert seen == listeners
+            assert {s.getsockname()[1] for s in listeners} == {port}
+        finally:
+            for listener in listeners:
+                listener.close()
+
+    def test_failure_closes_bound_listeners(self):
+        blocker = socket.socket()
+        blocker.bind(("127.0.0.1", 0))
+        blocker.listen()
+        port = blocker.getsockname()[1]
+
+        created = []
+        try:
+            with pytest.raises(OSError):
+                listen_reuseport("127.0.0.1", port, 2, setup=created.append)
+            assert all(s.fileno() == -1 for s in created)
+        finally:
+            blocker.close()
+
+
+class TestTuneSocket:
+    def _pair(self):
+        listener = socket.socket()
+        listener.bind(("127.0.0.1", 0))
+        listener.listen()
+        client = socket.create_connection(listener.getsockname())
+        server, _ = listener.accept()
+        listener.close()
+        return client, server
+
+    @pytest.mark.parametrize("nodelay", [True, False])
+    def test_sets_nodelay(self, nodelay):
+        client, server = self._pair()
+        try:
+            tune_socket(server, nodelay)
+            assert bool(server.getsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY)) is nodelay
+            assert not server.getsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE)
+        finally:
+            client.close()
+            server.close()
+
+    def test_sets_keepalive_when_requested(self):
+        client, server = self._pair()
+        try:
+            tune_socket(server, keepalive=True)
+            assert server.getsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE)
+        finally:
+            client.close()
+            server.close()
+
+    def test_tune_buffers_sets_requested_sizes(self):
+        sock = socket.socket()
+        try:
+            tune_buffers(sock, 128 * 1024, 96 * 1024)
+            assert sock.getsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF) >= 128 * 1024
+            assert sock.getsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF) >= 96 * 1024
+        finally:
+            sock.close()
+
+    def test_tune_buffers_none_keeps_defaults(self):
+        sock = socket.socket()
+        try:
+            before = sock.getsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF)
+            tune_buffers(sock)
+            assert sock.getsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF) == before
+        finally:
+            sock.close()
+
+    @pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="AF_UNIX not available")
+    def test_unix_socket_is_left_alone(self):
+        sock = MagicMock(family=socket.AF_UNIX)
+        tune_socket(sock, keepalive=True)
+        sock.setsockopt.assert_not_called()
+
+    @pytest.mark.skipif(not socket.has_ipv6, reason="IPv6 not available")
+    def test_ipv6_socket_is_tuned(self):
+        listener = socket.socket(socket.AF_INET6)
+        try:
+            listener.bind(("::1", 0))
+        except OSError:
+            listener.close()
+            pytest.skip("IPv6 loopback not available")
+        listener.listen()
+        client = socket.create_connection(listener.getsockname()[:2])
+        server, _ = listener.accept()
+        listener.close()
+        try:
+            tune_socket(server, nodelay=True, keepalive=True)
+            assert server.getsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY)
+            assert server.getsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE)
+        finally:
+            client.close()
+            server.close()
+
+
+@pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="AF_UNIX not available")
+class TestUnixSocketFile:
+    def test_stale_socket_file_is_replaced(self, tmp_path):
+        path = str(tmp_path / "stale.sock")
+        listen_unix(path).close()
+        listener = listen_unix(path)
+        listener.close()
+
+    def test_live_server_is_not_unlinked(self, tmp_path):
+        path = str(tmp_path / "live.sock")
+        listener = listen_unix(path)
+        try:
+            with pytest.raises(OSError) as info:
+                listen_unix(path)
+            assert info.value.errno == errno.EADDRINUSE
+            assert os.path.exists(path)
+        finally:
+            listener.close()
+
+    def test_unlink_skips_replaced_file(self, tmp_path):
+        path = str(tmp_path / "shared.sock")
+        listen_unix(path).close()
+        old_inode = os.stat(path).st_ino
+        # Keep the old inode alive so the new socket file cannot reuse its number.
+        os.link(path, str(tmp_path / "old.sock"))
+        listener = listen_unix(path)
+        try:
+            assert os.stat(path).st_ino != old_inode
+            unlink_unix(path, old_inode)
+            assert os.path.exists(path)
+            unlink_unix(path, os.stat(path).st_ino)
+            assert not os.path.exists(path)
+        finally:
+            listener.close()
+
+
+class TestGatherSend:
+    def test_skip_sent_drops_whole_and_partial_buffers(self):
+        rest = skip_sent([b"head", b"payload"], 6)
+        assert [bytes(v) for v in rest] == [b"yload"]
+
+    def test_skip_sent_nothing_sent_keeps_all(self):
+        rest = skip_sent([b"ab", b"", b"cd"], 0)
+        assert [bytes(v) for v in rest] == [b"ab", b"cd"]
+
+    @pytest.mark.skipif(not HAS_SENDMSG, reason="sendmsg not available")
+    def test_sendmsg_all_writes_every_buffer(self):
+        left, right = socket.socketpair()
+        try:
+            sendmsg_all(left, [b"head", b"x" * 100_000])
+            left.close()
+            received = bytearray()
+            while True:
+                chunk = right.recv(65536)
+                if not chunk:
+                    break
+                received += chunk
+            assert received == b"head" + b"x" * 100_000
+        finally:
+            right.close()
+
 
 # ── BufferSize ────────────────────────────────────────────────────────────────
 
@@ -122,6 +358,15 @@ class TestBufferSize:
     def test_medium_value(self):
         assert BufferSize.MEDIUM == 8192
 
+    def test_standard_value(self):
+        assert BufferSize.STANDARD == 16384
+
+    def test_configs_default_to_standard(self):
+        from veltix import ClientConfig, ServerConfig
+
+        assert ServerConfig().buffer_size == BufferSize.STANDARD
+        assert ClientConfig().buffer_size == BufferSize.STANDARD
+
     def test_large_value(self):
         assert BufferSize.LARGE == 65536
 
@@ -3,7 +3,7 @@
 import pytest
 
 from veltix import MessageType, Request, RequestError
-from veltix.network.constants import HEADER_SIZE, MAGIC, REQUEST_ID_SIZE
+from veltix.network.constants import HEADER_SIZE, HEADER_STRUCT, MAGIC, REQUEST_ID_SIZE
 from veltix.network.parser import MessageParser
 
 
@@ -108,3 +108,36 @@ class TestProtocol:
         compiled = request.compile()
         response = MessageParser.parse(compiled)
         assert response.content == b""
+
+    def test_parse_from_bytearray(self, test_message_type):
+        request = Request(test_message_type, b"buffered", request_id=3)
+        response = MessageParser.parse(bytearray(request.compile()))
+        assert response.content == b"buffered"
+        assert isinstance(response.content, bytes)
+
+    def test_parse_from_memoryview(self, test_message_type):
+        request = Request(test_message_type, b"viewed", request_id=4)
+        response = MessageParser.parse(memoryview(request.compile()))
+        assert response.content == b"viewed"
+        assert isinstance(response.content, bytes)
+        assert response.request_id == 4
+
+    def test_checksum_disabled_zeroes_hash(self, test_message_type):
+        request = Request(test_message_type, b"trusted", request_id=5, checksum=False)
+        compiled = request.compile()
+        hash_field = HEADER_STRUCT.unpack_from(compiled)[4]
+        assert hash_field == b"\x00" * 4
+        response = MessageParser.parse(compiled, allow_no_checksum=True)
+        assert response.content == b"trusted"
+
+    def test_checksum_disabled_rejected_by_default(self, test_message_type):
+        request = Request(test_message_type, b"trusted", request_id=5, checksum=False)
+        with pytest.raises(RequestError):
+            MessageParser.parse(request.compile())
+
+    def test_checksum_disabled_skips_verification(self, test_message_type):
+        request = Request(test_message_type, b"Hello", request_id=1, checksum=False)
+        corrupted = bytearray(request.compile())
+        corrupted[HEADER_SIZE] = (corrupted[HEADER_SIZE] + 1) % 256
+        response = MessageParser.parse(bytes(corrupted), allow_no_checksum=True)
+        assert response.content == b"Iello"
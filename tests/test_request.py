@@ -2,7 +2,8 @@
 
 import pytest
 
-from veltix import Request, RequestError
+from veltix import MessageType, Request, RequestError
+from veltix.network.constants import HEADER_STRUCT
 
 
 class TestRequestPayloads:
@@ -81,3 +82,15 @@ class TestRequestPayloadEdgeCases:
         request = Request(test_message_type, json={})
 
         assert request.content == b"{}"
+
+
+class TestRequestCompileHeader:
+    def test_compile_is_header_plus_content(self, test_message_type):
+        request = Request(test_message_type, b"payload")
+        assert request.compile() == request.compile_header() + b"payload"
+
+    def test_reassigned_type_is_compiled(self, test_message_type):
+        other = MessageType(3210, "request_retype")
+        request = Request(test_message_type, b"payload")
+        request.type = other
+        assert HEADER_STRUCT.unpack_from(request.compile_header())[2] == other.code
@@ -40,7 +40,6 @@ def make_context(
         handler._executor = MagicMock()
         handler.on_recv = (lambda c, r: None) if has_on_recv else None
         handler.pending_requests = {}
-        handler.pending_requests_lock = MagicMock()
         handler.handshake_handler = MagicMock()
 
     return MessageContext(response=response, handler=handler, is_server=is_server)
@@ -101,24 +100,45 @@ class TestPendingRequestRule:
         rule = PendingRequestRule()
         handler = MagicMock()
         handler.pending_requests = {}
-        handler.pending_requests_lock = MagicMock()
         request_id = 42
-        from queue import Queue
+        from concurrent.futures import Future
 
-        q = Queue()
-        handler.pending_requests[request_id] = q
+        future = Future()
+        handler.pending_requests[request_id] = future
 
         ctx = make_context(handler=handler, request_id=request_id)
         result = rule.try_handle(ctx)
         assert result is True
-        assert not q.empty()
-        assert q.get().content == b""
+        assert future.result(timeout=0).content == b""
+        assert handler.pending_requests[request_id] is future
+
+    def test_response_before_wait_is_delivered(self):
+        from veltix.handler.request_handler import RequestHandler
+        from veltix.internal.bus import VeltixBus
+
+        handler = RequestHandler(mode="client", bus=VeltixBus())
+        future = handler.register(7)
+        ctx = make_context(handler=handler, request_id=7)
+        assert PendingRequestRule().try_handle(ctx) is True
+        assert handler.wait(7, timeout=0.1, future=future) is ctx.response
+        handler.shutdown()
+
+    def test_response_before_wait_without_future(self):
+        from veltix.handler.request_handler import RequestHandler
+        from veltix.internal.bus import VeltixBus
+
+        handler = RequestHandler(mode="client", bus=VeltixBus())
+        handler.register(8)
+        ctx = make_context(handler=handler, request_id=8)
+        assert PendingRequestRule().try_handle(ctx) is True
+        assert handler.wait(8, timeout=0.1) is ctx.response
+        assert 8 not in handler.pending_requests
+        handler.shutdown()
 
     def test_try_handle_without_matching_request(self):
         rule = PendingRequestRule()
         handler = MagicMock()
         handler.pending_requests = {}
-        handler.pending_requests_lock = MagicMock()
         ctx = make_context(handler=handler, request_id=99)
         result = rule.try_handle(ctx)
         assert result is False
@@ -5,7 +5,7 @@ from unittest.mock import MagicMock
 import pytest
 
 from veltix import MessageType, Mode, Request, Sender, SenderError
-from veltix.network.constants import HEADER_SIZE
+from veltix.network.constants import GATHER_THRESHOLD, HEADER_SIZE
 
 # ── Fixture ───────────────────────────────────────────────────────────────────
 
@@ -61,6 +61,16 @@ class TestSenderSend:
         assert isinstance(sent_data, bytes)
         assert len(sent_data) == HEADER_SIZE + len(b"test")
 
+    def test_large_payload_is_gather_written(self):
+        sock = make_mock_socket()
+        sender = Sender(mode=Mode.CLIENT, conn=sock)
+        request = Request(MSG_TYPE, b"x" * GATHER_THRESHOLD)
+        assert sender.send(request) is True
+        sock.send.assert_not_called()
+        header, content = sock.sendv.call_args[0][0]
+        assert content is request.content
+        assert header + content == request.compile()
+
     def test_server_send_no_client_returns_false(self):
         sender = Sender(mode=Mode.SERVER)
         request = Request(MSG_TYPE, b"hello")
@@ -75,6 +85,18 @@ class TestSenderSend:
         assert result is True
         sock.send.assert_called_once()
 
+    def test_refused_send_returns_false(self):
+        sock = make_mock_socket()
+        sock.send.return_value = False
+        sender = Sender(mode=Mode.CLIENT, conn=sock)
+        assert sender.send(Request(MSG_TYPE, b"x")) is False
+
+    def test_refused_gather_write_returns_false(self):
+        sock = make_mock_socket()
+        sock.sendv.return_value = False
+        sender = Sender(mode=Mode.CLIENT, conn=sock)
+        assert sender.send(Request(MSG_TYPE, b"x" * GATHER_THRESHOLD)) is False
+
     def test_send_connection_reset_returns_false(self):
         sock = make_mock_socket()
         sock.send.side_effect = ConnectionResetError
@@ -124,6 +146,14 @@ class TestSenderBroadcast:
         result = sender.broadcast(Request(MSG_TYPE, b"test"), [sock])
         assert result is False
 
+    def test_broadcast_refused_gather_write_returns_false(self):
+        sockets = [make_mock_socket() for _ in range(2)]
+        sockets[0].sendv.return_value = False
+        sender = Sender(mode=Mode.SERVER)
+        result = sender.broadcast(Request(MSG_TYPE, b"x" * GATHER_THRESHOLD), sockets)
+        assert result is False
+        sockets[1].sendv.assert_called_once()
+
     def test_broadcast_partial_failure_returns_false(self):
         sockets = [make_mock_socket() for _ in range(3)]
         sockets[1].send.side_effect = ConnectionResetError
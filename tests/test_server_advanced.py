@@ -14,6 +14,28 @@ def find_free_port() -> int:
         return s.getsockname()[1]
 
 
+def connect_stalled_peer(port: int) -> socket.socket:
+    """Handshake with the server on ``port`` from a raw socket that never reads."""
+    from veltix.handler.handshake_handler import HandshakeHandler
+    from veltix.internal.bus import VeltixBus
+    from veltix.internal.mode import Mode
+
+    peer = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    peer.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 4096)
+    peer.connect(("127.0.0.1", port))
+    success, _ = HandshakeHandler(mode=Mode.CLIENT, bus=VeltixBus()).do_client_handshake(peer)
+    assert success
+    return peer
+
+
+def wait_for_clients(server: Server, count: int, timeout: float = 2.0) -> None:
+    import time
+
+    deadline = time.monotonic() + timeout
+    while len(server.clients) < count and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+
 class TestClientInfoProperties:
     """Tests for ClientInfo.ip and ClientInfo.port properties."""
 
@@ -258,3 +280,300 @@ class TestServerCloseClient:
         assert result is False
         sock.close()
         server.close_all()
+
+
+@pytest.mark.usefixtures("socket_core_backend")
+class TestServerTcpNoDelay:
+    """Tests for ServerConfig.tcp_nodelay."""
+
+    @pytest.mark.parametrize("enabled", [True, False])
+    def test_accepted_socket_follows_config(self, enabled):
+        port = find_free_port()
+        server = Server(ServerConfig(host="127.0.0.1", port=port, tcp_nodelay=enabled))
+        server.start()
+
+        client = Client(ClientConfig(server_addr="127.0.0.1", port=port))
+        client.connect()
+
+        conn = server.clients[0].conn
+        assert bool(conn._sock.getsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY)) is enabled
+
+        client.disconnect()
+        server.close_all()
+
+
+@pytest.mark.usefixtures("socket_core_backend")
+class TestTcpKeepalive:
+    """Tests for ServerConfig.tcp_keepalive / ClientConfig.tcp_keepalive."""
+
+    @pytest.mark.parametrize("enabled", [True, False])
+    def test_sockets_follow_config(self, enabled):
+        port = find_free_port()
+        server = Server(ServerConfig(host="127.0.0.1", port=port, tcp_keepalive=enabled))
+        server.start()
+
+        client = Client(ClientConfig(server_addr="127.0.0.1", port=port, tcp_keepalive=enabled))
+        client.connect()
+
+        for conn in (server.clients[0].conn, client.socket):
+            assert bool(conn._sock.getsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE)) is enabled
+
+        client.disconnect()
+        server.close_all()
+
+
+@pytest.mark.usefixtures("socket_core_backend")
+class TestServerSocketBuffers:
+    """Tests for ServerConfig.tcp_rcvbuf / tcp_sndbuf."""
+
+    def test_default_leaves_kernel_buffers_alone(self):
+        port = find_free_port()
+        server = Server(ServerConfig(host="127.0.0.1", port=port))
+        assert server.socket.tcp_rcvbuf is None
+        assert server.socket.tcp_sndbuf is None
+
+    def test_accepted_socket_inherits_buffer_sizes(self):
+        port = find_free_port()
+        size = 256 * 1024
+        server = Server(ServerConfig(host="127.0.0.1", port=port, tcp_rcvbuf=size, tcp_sndbuf=size))
+        server.start()
+
+        client = Client(ClientConfig(server_addr="127.0.0.1", port=port))
+        client.connect()
+
+        conn = server.clients[0].conn._sock
+        # Linux doubles the requested value for bookkeeping overhead.
+        assert conn.getsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF) >= size
+        assert conn.getsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF) >= size
+
+        client.disconnect()
+        server.close_all()
+
+
+@pytest.mark.usefixtures("socket_core_backend")
+class TestAllowNoChecksum:
+    """Tests for ServerConfig.allow_no_checksum / ClientConfig.allow_no_checksum."""
+
+    @pytest.mark.parametrize("allowed", [True, False])
+    def test_unchecksummed_request_follows_config(self, allowed):
+        import threading
+
+        port = find_free_port()
+        server = Server(ServerConfig(host="127.0.0.1", port=port, allow_no_checksum=allowed))
+        received = threading.Event()
+        server.on_recv(lambda client_info, response: received.set())
+        server.start()
+
+        client = Client(ClientConfig(server_addr="127.0.0.1", port=port))
+        assert client.connect()
+        request = Request(MessageType(code=2309, name="unchecked"), b"trusted", checksum=False)
+        assert client.send(request)
+
+        assert received.wait(timeout=1.0) is allowed
+
+        client.disconnect()
+        server.close_all()
+
+
+@pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="AF_UNIX not available")
+@pytest.mark.usefixtures("socket_core_backend")
+class TestServerUnixSocket:
+    """Tests for ServerConfig.unix_path / ClientConfig.unix_path."""
+
+    def test_round_trip_over_unix_socket(self, tmp_path):
+        path = str(tmp_path / "veltix.sock")
+        server = Server(ServerConfig(unix_path=path))
+
+        def on_message(client_info, response):
+            echo = Request(response.type, response.content, request_id=response.request_id)
+            server.sender.send(echo, client=client_info.conn)
+
+        server.on_recv(on_message)
+        server.start()
+
+        client = Client(ClientConfig(unix_path=path))
+        assert client.connect()
+        assert server.clients[0].addr == (path, 0)
+
+        request = Request(MessageType(code=2304, name="unix_echo"), b"over AF_UNIX")
+        response = client.send_and_wait(request, timeout=2.0)
+        assert response is not None
+        assert response.content == b"over AF_UNIX"
+
+        client.disconnect()
+        server.close_all()
+        assert not (tmp_path / "veltix.sock").exists()
+
+
+@pytest.mark.skipif(not hasattr(socket, "SO_REUSEPORT"), reason="SO_REUSEPORT not available")
+class TestServerAcceptors:
+    """Tests for ServerConfig.acceptors on the THREADING core."""
+
+    def test_multiple_acceptors_serve_clients(self):
+        from veltix import SocketCore
+
+        port = find_free_port()
+        server = Server(
+            ServerConfig(host="127.0.0.1", port=port, acceptors=3, socket_core=SocketCore.THREADING)
+        )
+        server.start()
+        assert len(server.socket._extra_listeners) == 2
+
+        clients = [Client(ClientConfig(server_addr="127.0.0.1", port=port)) for _ in range(6)]
+        for client in clients:
+            assert client.connect()
+        assert len(server.clients) == 6
+
+        for client in clients:
+            client.disconnect()
+        server.close_all()
+        for thread in server.socket._acceptor_threads:
+            thread.join(timeout=1.0)
+            assert not thread.is_alive()
+
+    @pytest.mark.parametrize("enabled", [True, False])
+    def test_extra_acceptors_follow_tcp_nodelay(self, enabled):
+        from veltix import SocketCore
+
+        port = find_free_port()
+        server = Server(
+            ServerConfig(
+                host="127.0.0.1",
+                port=port,
+                acceptors=3,
+                tcp_nodelay=enabled,
+                socket_core=SocketCore.THREADING,
+            )
+        )
+        server.start()
+        clients = [Client(ClientConfig(server_addr="127.0.0.1", port=port)) for _ in range(8)]
+        try:
+            for client in clients:
+                assert client.connect()
+            wait_for_clients(server, len(clients))
+            for info in server.clients:
+                nodelay = info.conn._sock.getsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY)
+                assert bool(nodelay) is enabled
+            if not enabled:
+                # The listener setup hook must not force the option on either.
+                for listener in server.socket._extra_listeners:
+                    assert not listener.getsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY)
+        finally:
+            for client in clients:
+                client.disconnect()
+            server.close_all()
+
+
+class TestSendToStalledPeer:
+    """send()/broadcast() report False once the ASYNC outbox for a peer is full."""
+
+    def test_server_send_returns_false(self):
+        port = find_free_port()
+        server = Server(ServerConfig(host="127.0.0.1", port=port, max_outbox_size=256 * 1024))
+        server.start()
+
+        peer = connect_stalled_peer(port)
+        try:
+            wait_for_clients(server, 1)
+
+            request = Request(MessageType(code=2305, name="stalled_server"), b"x" * 16 * 1024)
+            results = [server.send(request, server.clients[0]) for _ in range(200)]
+            assert results[0] is True
+            assert False in results
+            assert server.broadcast(request) is False
+            large = Request(MessageType(code=2307, name="stalled_large"), b"x" * 128 * 1024)
+            assert server.send(large, server.clients[0]) is False
+        finally:
+            peer.close()
+            server.close_all()
+
+    def test_client_send_returns_false(self):
+        import threading
+
+        from veltix.handler.handshake_handler import HandshakeHandler
+        from veltix.internal.bus import VeltixBus
+        from veltix.internal.mode import Mode
+
+        listener = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        listener.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 4096)
+        listener.bind(("127.0.0.1", 0))
+        listener.listen()
+        accepted: list = []
+
+        def accept() -> None:
+            conn, _ = listener.accept()
+            accepted.append(conn)
+            HandshakeHandler(mode=Mode.SERVER, bus=VeltixBus()).do_server_handshake(conn)
+
+        thread = threading.Thread(target=accept, daemon=True)
+        thread.start()
+        client = Client(
+            ClientConfig(
+                server_addr="127.0.0.1",
+                port=listener.getsockname()[1],
+                max_outbox_size=256 * 1024,
+            )
+        )
+        try:
+            assert client.connect()
+            thread.join(timeout=2.0)
+
+            request = Request(MessageType(code=2306, name="stalled_client"), b"x" * 16 * 1024)
+            results = [client.send(request) for _ in range(200)]
+            assert results[0] is True
+            assert False in results
+        finally:
+            client.disconnect()
+            for conn in accepted:
+                conn.close()
+            listener.close()
+
+
+class TestCloseWithStalledPeers:
+    """close_all() bounds the outbox drain with one deadline shared by all clients."""
+
+    def test_close_all_time_does_not_grow_with_clients(self):
+        import time
+
+        port = find_free_port()
+        server = Server(ServerConfig(host="127.0.0.1", port=port, tcp_sndbuf=16 * 1024))
+        server.start()
+
+        peers = [connect_stalled_peer(port) for _ in range(10)]
+        try:
+            wait_for_clients(server, 10)
+            request = Request(MessageType(code=2308, name="stalled_close"), b"x" * 16 * 1024)
+            for client in server.clients:
+                for _ in range(64):
+                    server.send(request, client)
+
+            started = time.monotonic()
+            server.close_all()
+            assert time.monotonic() - started < 1.0
+        finally:
+            for peer in peers:
+                peer.close()
+
+
+@pytest.mark.usefixtures("socket_core_backend")
+class TestServerCloseFlushes:
+    """close_all() must deliver data that send() already accepted."""
+
+    def test_queued_message_reaches_client_after_close_all(self):
+        import threading
+
+        port = find_free_port()
+        server = Server(ServerConfig(host="127.0.0.1", port=port))
+        server.start()
+
+        received = threading.Event()
+        payload = b"y" * (8 * 1024 * 1024)
+        client = Client(ClientConfig(server_addr="127.0.0.1", port=port))
+        client.on_recv(lambda response: received.set() if response.content == payload else None)
+        assert client.connect()
+
+        assert server.send(Request(MessageType(code=2305, name="big"), payload), server.clients[0])
+        server.close_all()
+
+        assert received.wait(timeout=5.0)
+        client.disconnect()
@@ -1,6 +1,8 @@
 """Unit tests for ThreadingSocket and AsyncSocket error paths."""
 
+import selectors
 import socket
+import time
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -51,6 +53,19 @@ class TestThreadingSocketUnit:
         entry = ClientEntry(id=1, info=info, buffer=MessageBuffer(1024))
         assert sock.close_client(entry) is True
 
+    def test_close_twice_emits_disconnect_once(self, sock):
+        from veltix.internal.events import ServerEvent
+
+        info = ClientInfo(conn=MagicMock(), addr=("127.0.0.1", 0), thread_id=1)
+        client_id = sock.client_manager.add_client(info)
+        entry = sock.client_manager.get_client(client_id)
+
+        received = []
+        sock.bus.subscribe(ServerEvent.ON_DISCONNECT, lambda e, p: received.append(p))
+        sock.close_client(entry)
+        sock.close_client(entry)
+        assert received == [info]
+
     def test_close_client_with_registered_id(self, sock):
         from veltix.internal.events import ServerEvent
 
@@ -89,6 +104,22 @@ class TestThreadingSocketUnit:
             sock._accept_loop("0.0.0.0", 8080, -1, 1024, 0.5)
         assert not sock._running_event.is_set()
 
+    def test_close_all_wakes_accept_loop(self, sock):
+        from veltix.internal.events import ErrorEvent
+
+        errors = []
+        sock.bus.subscribe(ErrorEvent.ACCEPT, lambda e, p: errors.append(p))
+        assert sock.bind("127.0.0.1", 0, -1, 1024, 0.5) is True
+        while not sock._wakers:
+            time.sleep(0.01)
+
+        started = time.monotonic()
+        assert sock.close_all() is True
+        sock.start_th.join(timeout=1.0)
+        assert not sock.start_th.is_alive()
+        assert time.monotonic() - started < 0.5
+        assert errors == []
+
     def test_connect_handshake_failure(self, sock):
         with patch.object(socket.socket, "connect"), patch.object(
             sock.request_handler.handshake_handler,
@@ -118,24 +149,69 @@ class TestAsyncSocketUnit:
             assert sock.settimeout(1.0) is False
 
     def test_send_failure(self, sock):
-        with patch.object(socket.socket, "sendall", side_effect=OSError("mock")):
+        with patch.object(socket.socket, "send", side_effect=OSError("mock")):
             assert sock.send(b"data") is False
 
-    def test_send_blockingioerror_fallback(self, sock):
-        with patch.object(
-            socket.socket,
-            "sendall",
-            side_effect=BlockingIOError("mock"),
-        ), patch.object(socket.socket, "setblocking", side_effect=OSError("mock")):
-            assert sock.send(b"data") is False
+    def test_send_blockingioerror_without_selector_falls_back_to_sendall(self, sock):
+        with patch.object(socket.socket, "send", side_effect=BlockingIOError("mock")), patch.object(
+            socket.socket, "sendall", return_value=None
+        ) as sendall:
+            assert sock.send(b"data") is True
+        assert bytes(sendall.call_args[0][0]) == b"data"
 
-    def test_send_blockingioerror_fallback_success(self, sock):
-        with patch.object(
-            socket.socket,
-            "sendall",
-            side_effect=[BlockingIOError("mock"), None],
-        ), patch.object(socket.socket, "setblocking", return_value=None):
+    def test_send_partial_write_queues_remainder(self, sock):
+        selector = MagicMock()
+        sock._watch_writes(selector, sock._sock, "client")
+        with patch.object(socket.socket, "send", return_value=2):
             assert sock.send(b"data") is True
+            assert sock.send(b"more") is True
+        assert sock._outbox == b"tamore"
+        selector.modify.assert_called_once()
+
+    def test_send_refused_once_outbox_is_full(self, sock):
+        from veltix.internal.events import ErrorEvent
+
+        errors = []
+        sock.bus.subscribe(ErrorEvent.SEND, lambda e, p: errors.append(p))
+        sock.max_outbox_size = 10
+        sock._watch_writes(MagicMock(), sock._sock, "client")
+        with patch.object(socket.socket, "send", return_value=0):
+            assert sock.send(b"12345678") is True
+            assert sock.send(b"12") is True
+            assert sock.send(b"3") is False
+        assert sock._outbox == b"1234567812"
+        assert errors and errors[0]["size"] == 1
+
+    def test_outbox_bounded_when_peer_never_reads(self):
+        from veltix.socket_core.async_socket import AsyncSocket
+
+        left, right = socket.socketpair()
+        try:
+            conn = AsyncSocket._create_client_instance(
+                left, _make_bus(), _make_handler(), 1024, max_outbox_size=4 * 1024 * 1024
+            )
+            selector = selectors.DefaultSelector()
+            selector.register(conn, selectors.EVENT_READ, data=1)
+            conn._watch_writes(selector, conn, 1)
+
+            chunk = b"x" * (1024 * 1024)
+            results = [conn.send(chunk) for _ in range(300)]
+
+            assert not all(results)
+            assert len(conn._outbox) <= 4 * 1024 * 1024
+            selector.close()
+        finally:
+            left.close()
+            right.close()
+
+    def test_flush_outbox_sends_queued_bytes(self, sock):
+        selector = MagicMock()
+        sock._watch_writes(selector, sock._sock, "client")
+        sock._outbox += b"pending"
+        with patch.object(socket.socket, "send", return_value=7):
+            sock._flush_outbox()
+        assert not sock._outbox
+        selector.modify.assert_called_once_with(sock._sock, selectors.EVENT_READ, data="client")
 
     def test_accept_client_max_clients_reached(self, sock):
         sock.client_manager.add_client(sock)  # type: ignore